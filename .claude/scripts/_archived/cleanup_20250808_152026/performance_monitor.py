@@ -19,13 +19,25 @@ dependencies:
 
 import json
 import time
-import psutil
 import threading
 from pathlib import Path
 from datetime import datetime, timedelta
 from collections import defaultdict, deque
 import statistics
 
+# psutil is imported on first resource sample so the track_performance
+# decorator can be imported without paying for it
+psutil = None
+
+
+def _load_psutil():
+    """Import psutil on first use and cache it at module level"""
+    global psutil
+    if psutil is None:
+        import psutil as _psutil
+        psutil = _psutil
+    return psutil
+
 class PerformanceMonitor:
     """Real-time performance monitoring for multi-agent system"""
     
@@ -35,6 +47,10 @@ class PerformanceMonitor:
         self.metrics_file = self.claude_dir / 'performance_metrics.json'
         self.metrics_log = self.claude_dir / 'logs' / 'performance' / f'perf_{datetime.now().strftime("%Y%m%d")}.jsonl'
         
+        # Session start: monotonic clock for durations, wall clock for display
+        self._session_mono = time.monotonic()
+        self._session_epoch = time.time()
+        
         # In-memory metrics storage
         self.metrics = {
             'agent_executions': defaultdict(list),
@@ -42,7 +58,7 @@ class PerformanceMonitor:
             'resource_usage': deque(maxlen=1000),  # Keep last 1000 samples
             'task_completions': defaultdict(list),
             'errors': defaultdict(int),
-            'session_start': datetime.now().isoformat()
+            'session_start': datetime.fromtimestamp(self._session_epoch).isoformat()
         }
         
         # Ensure directories exist
@@ -60,6 +76,10 @@ class PerformanceMonitor:
             current = current.parent
         return Path.cwd()
     
+    def _session_duration(self):
+        """Elapsed session time as a string, without re-parsing session_start"""
+        return str(timedelta(seconds=time.monotonic() - self._session_mono))
+    
     def _load_metrics(self):
         """Load existing metrics from file"""
         if self.metrics_file.exists():
@@ -164,6 +184,7 @@ class PerformanceMonitor:
     def track_resource_usage(self):
         """Track system resource usage"""
         try:
+            _load_psutil()
             cpu_percent = psutil.cpu_percent(interval=0.1)
             memory = psutil.virtual_memory()
             disk = psutil.disk_usage(str(self.project_root))
@@ -204,7 +225,7 @@ class PerformanceMonitor:
             'tasks': {},
             'resources': {},
             'errors': dict(self.metrics['errors']),
-            'session_duration': str(datetime.now() - datetime.fromisoformat(self.metrics['session_start']))
+            'session_duration': self._session_duration()
         }
         
         # Agent performance
@@ -374,7 +395,7 @@ class PerformanceMonitor:
             'export_time': datetime.now().isoformat(),
             'session_info': {
                 'start': self.metrics['session_start'],
-                'duration': str(datetime.now() - datetime.fromisoformat(self.metrics['session_start']))
+                'duration': self._session_duration()
             },
             'summary': self.get_performance_summary(),
             'raw_metrics': {
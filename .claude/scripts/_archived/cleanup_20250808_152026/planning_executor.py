@@ -5,20 +5,99 @@ Planning command executor - analyzes tasks and creates parallel execution plans
 
 import os
 import re
+import sys
 import json
+import functools
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, Set, Tuple, Iterator
 from dataclasses import dataclass
 from enum import Enum
 
+# tasks.md line patterns; anchors absorb surrounding whitespace so lines
+# need no strip()/startswith() pre-checks
+_SECTION_RE = re.compile(r'^### [#\s]*(.*?)[#\s]*$')
+_TASK_RE = re.compile(r'^\s*- \[ \] (\d+\.?\d*)\.\s+(.+?)\s*$')
+
+# Agent keyword buckets in priority order; the first bucket with a keyword
+# that starts a word of the description decides the agent, so stems such as
+# "auth" still cover "authentication" and "deploy" covers "deployment".
+# Agent names are interned so every Task shares one string object per agent.
+_AGENT_KEYWORDS = [
+    (sys.intern(agent), tuple(words))
+    for agent, words in [
+        ('developer', ['model', 'schema', 'database', 'table',
+                       'api', 'endpoint', 'service', 'controller',
+                       'ui', 'component', 'screen', 'page', 'frontend']),
+        ('qa-engineer', ['test', 'testing', 'spec']),
+        ('security-engineer', ['auth', 'oauth', 'security', 'permission']),
+        ('data-engineer', ['pipeline', 'etl', 'data flow']),
+        ('devops-engineer', ['deploy', 'ci/cd', 'infrastructure']),
+    ]
+]
+_DEFAULT_AGENT = sys.intern('developer')
+
+# Words, keeping slash compounds such as "ci/cd" together
+_WORD_RE = re.compile(r'[a-z]+(?:/[a-z]+)*')
+
+# Requirement features detected for design planning, as substring matches;
+# the named group that matched identifies the feature without lowercasing
+_REQ_FEATURES_RE = re.compile(
+    r'(?=(?P<ui>interface|ui)|(?P<api>api|endpoint)|(?P<data>database|data))',
+    re.IGNORECASE
+)
+
+@functools.lru_cache(maxsize=1024)
+def _determine_agent(description: str, section: str) -> str:
+    """Determine which agent should handle a task (memoized, task phrasing repeats)"""
+    words = _WORD_RE.findall(description.lower())
+    tokens = set(words)
+    for word in words:
+        if '/' in word:
+            tokens.update(word.split('/'))
+    tokens.update(f"{first} {second}" for first, second in zip(words, words[1:]))
+    
+    for agent, keywords in _AGENT_KEYWORDS:
+        if any(token.startswith(keywords) for token in tokens):
+            return agent
+    return _DEFAULT_AGENT
+
+@functools.lru_cache(maxsize=4)
+def _find_project_root(cwd: str) -> Path:
+    """Find project root by looking for .claude directory (cached per cwd)"""
+    current = Path(cwd)
+    while current != current.parent:
+        if (current / '.claude').exists():
+            return current
+        current = current.parent
+    return Path(cwd)
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 class PlanningPhase(Enum):
     ANALYSIS = "analysis"
     DESIGN = "design"
     IMPLEMENTATION = "implementation"
     TESTING = "testing"
 
-@dataclass
+# Phases whose plan depends on a spec file; their rendered output is cached
+# under .claude/cache/plans (outside the spec tree), keyed on that file's
+# mtime and size
+_PLAN_INPUTS = {
+    PlanningPhase.DESIGN: 'requirements.md',
+    PlanningPhase.IMPLEMENTATION: 'tasks.md',
+}
+_PLAN_CACHE_VERSION = 1
+
+# One format call renders a task's block in the implementation plan
+_TASK_TEMPLATE = (
+    "- **Task {task.id}**: {task.description}\n"
+    "  - Agent: `{task.agent}`\n"
+    "  - Command: `{task.command}`\n"
+)
+
+@dataclass(**_SLOTS)
 class Task:
     id: str
     description: str
@@ -26,7 +105,7 @@ class Task:
     dependencies: List[str]
     command: str = ""
 
-@dataclass
+@dataclass(**_SLOTS)
 class ExecutionBatch:
     batch_number: int
     tasks: List[Task]
@@ -36,18 +115,10 @@ class PlanningExecutor:
     def __init__(self, phase: str, spec_name: str):
         self.phase = PlanningPhase(phase.lower())
         self.spec_name = spec_name
-        self.project_root = self._find_project_root()
+        self.project_root = _find_project_root(str(Path.cwd()))
         self.spec_dir = self.project_root / '.claude' / 'specs' / spec_name
+        self.plan_cache_file = self.project_root / '.claude' / 'cache' / 'plans' / f'{spec_name}.json'
         
-    def _find_project_root(self):
-        """Find project root by looking for .claude directory"""
-        current = Path.cwd()
-        while current != current.parent:
-            if (current / '.claude').exists():
-                return current
-            current = current.parent
-        return Path.cwd()
-    
     def plan_analysis(self) -> str:
         """Plan parallel analysis tasks"""
         agents = [
@@ -58,17 +129,17 @@ class PlanningExecutor:
             ("data-engineer", "Data requirements and pipeline needs"),
         ]
         
-        output = "## Parallel Analysis Plan\n\n"
-        output += "### Batch 1 (Can run simultaneously):\n"
+        parts = ["## Parallel Analysis Plan\n\n"]
+        parts.append("### Batch 1 (Can run simultaneously):\n")
         
         for agent, description in agents:
-            output += f"- **{agent}**: {description}\n"
-            output += f"  - Command: `Use {agent} agent to analyze {self.spec_name}`\n"
+            parts.append(f"- **{agent}**: {description}\n")
+            parts.append(f"  - Command: `Use {agent} agent to analyze {self.spec_name}`\n")
         
-        output += "\n### Coordination:\n"
-        output += "After all analysis complete, synthesize findings into unified requirements.\n"
+        parts.append("\n### Coordination:\n")
+        parts.append("After all analysis complete, synthesize findings into unified requirements.\n")
         
-        return output
+        return "".join(parts)
     
     def plan_design(self) -> str:
         """Plan parallel design tasks"""
@@ -80,33 +151,38 @@ class PlanningExecutor:
         
         if req_file.exists():
             content = req_file.read_text()
-            has_ui = 'interface' in content.lower() or 'ui' in content.lower()
-            has_api = 'api' in content.lower() or 'endpoint' in content.lower()
-            has_data = 'database' in content.lower() or 'data' in content.lower()
+            found = set()
+            for match in _REQ_FEATURES_RE.finditer(content):
+                found.add(match.lastgroup)
+                if len(found) == 3:
+                    break
+            has_ui = 'ui' in found
+            has_api = 'api' in found
+            has_data = 'data' in found
         
-        output = "## Parallel Design Plan\n\n"
-        output += "### Batch 1 (Can run simultaneously):\n"
+        parts = ["## Parallel Design Plan\n\n"]
+        parts.append("### Batch 1 (Can run simultaneously):\n")
         
         if has_ui:
-            output += "- **uiux-designer**: Frontend component design\n"
-            output += "  - Command: `/spec-design uiux`\n"
+            parts.append("- **uiux-designer**: Frontend component design\n")
+            parts.append("  - Command: `/spec-design uiux`\n")
         
-        output += "- **architect**: Backend architecture and API design\n"
-        output += "  - Command: `/spec-design architecture`\n"
+        parts.append("- **architect**: Backend architecture and API design\n")
+        parts.append("  - Command: `/spec-design architecture`\n")
         
         if has_data:
-            output += "- **data-engineer**: Data model and pipeline design\n"
-            output += "  - Command: `Use data-engineer agent for data design`\n"
+            parts.append("- **data-engineer**: Data model and pipeline design\n")
+            parts.append("  - Command: `Use data-engineer agent for data design`\n")
         
-        output += "- **security-engineer**: Security architecture\n"
-        output += "  - Command: `Use security-engineer agent for security design`\n"
+        parts.append("- **security-engineer**: Security architecture\n")
+        parts.append("  - Command: `Use security-engineer agent for security design`\n")
         
         if has_api:
-            output += "\n### Batch 2 (After architecture):\n"
-            output += "- **developer**: API specification and contracts\n"
-            output += "  - Command: `Create OpenAPI specification`\n"
+            parts.append("\n### Batch 2 (After architecture):\n")
+            parts.append("- **developer**: API specification and contracts\n")
+            parts.append("  - Command: `Create OpenAPI specification`\n")
         
-        return output
+        return "".join(parts)
     
     def parse_tasks_file(self) -> List[Task]:
         """Parse tasks from tasks.md file"""
@@ -115,64 +191,46 @@ class PlanningExecutor:
             return []
         
         tasks = []
+        seen_ids: Set[str] = set()
         current_section = None
         
-        with open(tasks_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                # Section headers
-                if line.startswith('### '):
-                    current_section = line.strip('# \n')
+        section_match = _SECTION_RE.match
+        task_match = _TASK_RE.match
+        
+        for line in tasks_file.read_text(encoding='utf-8').splitlines():
+            # Section headers
+            match = section_match(line)
+            if match:
+                current_section = sys.intern(match.group(1))
+                continue
+            
+            # Task items
+            match = task_match(line)
+            if match:
+                task_id = match.group(1)
+                description = match.group(2)
+                
+                # Determine agent based on task type
+                agent = _determine_agent(description, current_section)
+                
+                # Determine dependencies based on ID
+                deps = self._determine_dependencies(task_id, seen_ids)
+                
+                # Create command
+                command = f"/{self.spec_name}-task-{task_id.replace('.', '-')}"
                 
-                # Task items
-                if line.strip().startswith('- [ ] '):
-                    # Extract task ID and description
-                    match = re.match(r'- \[ \] (\d+\.?\d*)\.\s+(.+)', line.strip())
-                    if match:
-                        task_id = match.group(1)
-                        description = match.group(2)
-                        
-                        # Determine agent based on task type
-                        agent = self._determine_agent(description, current_section)
-                        
-                        # Determine dependencies based on ID
-                        deps = self._determine_dependencies(task_id, tasks)
-                        
-                        # Create command
-                        command = f"/{self.spec_name}-task-{task_id.replace('.', '-')}"
-                        
-                        tasks.append(Task(
-                            id=task_id,
-                            description=description,
-                            agent=agent,
-                            dependencies=deps,
-                            command=command
-                        ))
+                tasks.append(Task(
+                    id=task_id,
+                    description=description,
+                    agent=agent,
+                    dependencies=deps,
+                    command=command
+                ))
+                seen_ids.add(task_id)
         
         return tasks
     
-    def _determine_agent(self, description: str, section: str) -> str:
-        """Determine which agent should handle a task"""
-        desc_lower = description.lower()
-        
-        # Keywords for different agents
-        if any(word in desc_lower for word in ['model', 'schema', 'database', 'table']):
-            return 'developer'
-        elif any(word in desc_lower for word in ['api', 'endpoint', 'service', 'controller']):
-            return 'developer'
-        elif any(word in desc_lower for word in ['ui', 'component', 'screen', 'page', 'frontend']):
-            return 'developer'
-        elif any(word in desc_lower for word in ['test', 'testing', 'spec']):
-            return 'qa-engineer'
-        elif any(word in desc_lower for word in ['auth', 'security', 'permission']):
-            return 'security-engineer'
-        elif any(word in desc_lower for word in ['pipeline', 'etl', 'data flow']):
-            return 'data-engineer'
-        elif any(word in desc_lower for word in ['deploy', 'ci/cd', 'infrastructure']):
-            return 'devops-engineer'
-        else:
-            return 'developer'  # Default
-    
-    def _determine_dependencies(self, task_id: str, existing_tasks: List[Task]) -> List[str]:
+    def _determine_dependencies(self, task_id: str, seen_ids: Set[str]) -> List[str]:
         """Determine task dependencies based on ID hierarchy"""
         deps = []
         
@@ -184,7 +242,7 @@ class PlanningExecutor:
             # Depends on previous subtask if exists
             if parent_num > 1:
                 prev_id = f"{parent_base}.{parent_num - 1}"
-                if any(t.id == prev_id for t in existing_tasks):
+                if prev_id in seen_ids:
                     deps.append(prev_id)
         else:
             # Top-level tasks depend on previous top-level
@@ -192,66 +250,78 @@ class PlanningExecutor:
             if task_num > 1:
                 prev_id = str(task_num - 1)
                 # Only add if no subtasks exist for previous
-                if any(t.id == prev_id for t in existing_tasks):
+                if prev_id in seen_ids:
                     deps.append(prev_id)
         
         return deps
     
     def create_execution_batches(self, tasks: List[Task]) -> List[ExecutionBatch]:
         """Group tasks into execution batches based on dependencies"""
-        batches = []
+        return list(self.iter_execution_batches(tasks))
+    
+    def iter_execution_batches(self, tasks: List[Task]) -> Iterator[ExecutionBatch]:
+        """Yield execution batches in dependency order.
+
+        Kahn's algorithm in rounds: the tasks that become ready in the same
+        round only depend on earlier batches, so each round is one batch and
+        can be yielded immediately.
+        """
+        # Schedule on integer indices (parallel arrays) and only map back
+        # to Task objects when building the batches. A dependency names a
+        # task id and is met once any task with that id has run, so a
+        # repeated id in tasks.md keeps its original ordering.
+        in_degree = []
+        waiting: Dict[str, List[int]] = {}
+        
+        for i, task in enumerate(tasks):
+            deps = set(task.dependencies)
+            in_degree.append(len(deps))
+            for dep in deps:
+                waiting.setdefault(dep, []).append(i)
+        
         completed: Set[str] = set()
-        remaining = tasks.copy()
+        ready = [i for i, degree in enumerate(in_degree) if degree == 0]
+        scheduled = 0
         batch_num = 1
         
-        while remaining:
-            # Find tasks that can be executed (dependencies satisfied)
-            ready = []
-            for task in remaining:
-                if all(dep in completed for dep in task.dependencies):
-                    ready.append(task)
-            
-            if not ready:
-                # Circular dependency or error
-                print(f"Warning: Cannot resolve dependencies for {len(remaining)} tasks")
-                break
-            
-            # Group by whether they can run in parallel
-            # Tasks with no dependencies on each other can run in parallel
-            batch_tasks = []
-            task_ids = [t.id for t in ready]
-            
-            for task in ready:
-                # Check if this task is a dependency for any other ready task
-                is_dependency = any(
-                    task.id in other.dependencies 
-                    for other in ready 
-                    if other.id != task.id
-                )
-                
-                if not is_dependency:
-                    batch_tasks.append(task)
-            
-            # If no parallel tasks found, just take the first ready task
-            if not batch_tasks:
-                batch_tasks = [ready[0]]
-            
-            can_parallel = len(batch_tasks) > 1
+        while ready:
+            # Only a repeated id can leave a ready task that another ready
+            # task depends on; it is held back for the next round
+            blocking = {
+                dep for i in ready for dep in tasks[i].dependencies
+                if dep != tasks[i].id
+            }
+            if blocking:
+                batch = [i for i in ready if tasks[i].id not in blocking] or ready[:1]
+                batched = set(batch)
+                next_ready = [i for i in ready if i not in batched]
+            else:
+                batch, next_ready = ready, []
             
-            batches.append(ExecutionBatch(
+            yield ExecutionBatch(
                 batch_number=batch_num,
-                tasks=batch_tasks,
-                can_parallel=can_parallel
-            ))
+                tasks=[tasks[i] for i in batch],
+                can_parallel=len(batch) > 1
+            )
+            scheduled += len(batch)
             
-            # Mark as completed and remove from remaining
-            for task in batch_tasks:
-                completed.add(task.id)
-                remaining.remove(task)
+            for i in batch:
+                task_id = tasks[i].id
+                if task_id in completed:
+                    continue
+                completed.add(task_id)
+                for child in waiting.get(task_id, ()):
+                    in_degree[child] -= 1
+                    if in_degree[child] == 0:
+                        next_ready.append(child)
             
+            next_ready.sort()  # Keep tasks.md order within a batch
+            ready = next_ready
             batch_num += 1
         
-        return batches
+        if scheduled < len(tasks):
+            # Circular dependency or error
+            print(f"Warning: Cannot resolve dependencies for {len(tasks) - scheduled} tasks")
     
     def plan_implementation(self) -> str:
         """Plan implementation task execution"""
@@ -260,42 +330,46 @@ class PlanningExecutor:
         if not tasks:
             return "## No tasks found\n\nPlease generate tasks first using `/spec-tasks`"
         
-        batches = self.create_execution_batches(tasks)
+        parts = [f"## Implementation Execution Plan\n\n"]
+        parts.append(f"Total tasks: {len(tasks)}\n")
+        parts.append(None)  # Batch count, filled in once batches are consumed
+        batch_count_slot = len(parts) - 1
         
-        output = f"## Implementation Execution Plan\n\n"
-        output += f"Total tasks: {len(tasks)}\n"
-        output += f"Execution batches: {len(batches)}\n\n"
+        batch_count = 0
+        parallel_count = 0
+        time_saved = 0
         
-        for batch in batches:
+        for batch in self.iter_execution_batches(tasks):
+            batch_count += 1
             if batch.can_parallel:
-                output += f"### Batch {batch.batch_number} (Can run simultaneously):\n"
+                parallel_count += 1
+                time_saved += len(batch.tasks) - 1
+                parts.append(f"### Batch {batch.batch_number} (Can run simultaneously):\n")
             else:
-                output += f"### Batch {batch.batch_number} (Sequential):\n"
+                parts.append(f"### Batch {batch.batch_number} (Sequential):\n")
             
             for task in batch.tasks:
-                output += f"- **Task {task.id}**: {task.description}\n"
-                output += f"  - Agent: `{task.agent}`\n"
-                output += f"  - Command: `{task.command}`\n"
+                parts.append(_TASK_TEMPLATE.format(task=task))
                 if task.dependencies:
-                    output += f"  - Dependencies: {', '.join(task.dependencies)}\n"
-            output += "\n"
+                    parts.append(f"  - Dependencies: {', '.join(task.dependencies)}\n")
+            parts.append("\n")
+        
+        parts[batch_count_slot] = f"Execution batches: {batch_count}\n\n"
         
         # Add execution summary
-        output += "### Execution Strategy:\n"
-        parallel_count = sum(1 for b in batches if b.can_parallel)
+        parts.append("### Execution Strategy:\n")
         if parallel_count > 0:
-            output += f"- {parallel_count} batches can run in parallel\n"
-            time_saved = sum(len(b.tasks) - 1 for b in batches if b.can_parallel)
-            output += f"- Estimated time savings: {time_saved} task durations\n"
+            parts.append(f"- {parallel_count} batches can run in parallel\n")
+            parts.append(f"- Estimated time savings: {time_saved} task durations\n")
         else:
-            output += "- All tasks must run sequentially\n"
+            parts.append("- All tasks must run sequentially\n")
         
-        return output
+        return "".join(parts)
     
     def plan_testing(self) -> str:
         """Plan parallel testing tasks"""
-        output = "## Parallel Testing Plan\n\n"
-        output += "### Batch 1 (Can run simultaneously):\n"
+        parts = ["## Parallel Testing Plan\n\n"]
+        parts.append("### Batch 1 (Can run simultaneously):\n")
         
         test_types = [
             ("Unit Tests", "qa-engineer", "Create and run unit tests"),
@@ -305,17 +379,58 @@ class PlanningExecutor:
         ]
         
         for test_name, agent, description in test_types:
-            output += f"- **{test_name}** ({agent}): {description}\n"
-            output += f"  - Command: `Use {agent} agent for {test_name.lower()}`\n"
+            parts.append(f"- **{test_name}** ({agent}): {description}\n")
+            parts.append(f"  - Command: `Use {agent} agent for {test_name.lower()}`\n")
         
-        output += "\n### Batch 2 (After all tests):\n"
-        output += "- **Test Report**: Consolidate all test results\n"
-        output += "- **Quality Gate**: Verify all tests pass before deployment\n"
+        parts.append("\n### Batch 2 (After all tests):\n")
+        parts.append("- **Test Report**: Consolidate all test results\n")
+        parts.append("- **Quality Gate**: Verify all tests pass before deployment\n")
         
-        return output
+        return "".join(parts)
     
     def execute(self) -> str:
-        """Execute planning based on phase"""
+        """Execute planning based on phase, reusing a cached plan when inputs are unchanged"""
+        cache_key = self._plan_cache_key()
+        if cache_key is None:
+            return self._build_plan()
+        
+        cache_file = self.plan_cache_file
+        cache = {}
+        try:
+            cache = json.loads(cache_file.read_text(encoding='utf-8'))
+            entry = cache.get(self.phase.value, {})
+            if entry.get('key') == cache_key:
+                return entry['output']
+        except (OSError, ValueError, AttributeError, KeyError):
+            cache = {}
+        
+        output = self._build_plan()
+        
+        if self.spec_dir.is_dir():
+            cache[self.phase.value] = {'key': cache_key, 'output': output}
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(json.dumps(cache), encoding='utf-8')
+            except OSError:
+                pass  # Caching is best-effort
+        
+        return output
+    
+    def _plan_cache_key(self):
+        """Cache key for the current phase, or None if the phase reads no spec file"""
+        input_name = _PLAN_INPUTS.get(self.phase)
+        if input_name is None:
+            return None
+        
+        try:
+            stat = (self.spec_dir / input_name).stat()
+            stamp = [stat.st_mtime_ns, stat.st_size]
+        except OSError:
+            stamp = [0, 0]
+        return [_PLAN_CACHE_VERSION, self.spec_name, *stamp]
+    
+    def _build_plan(self) -> str:
+        """Build the plan for the current phase"""
         if self.phase == PlanningPhase.ANALYSIS:
             return self.plan_analysis()
         elif self.phase == PlanningPhase.DESIGN:
@@ -348,32 +463,32 @@ def main():
         # JSON output for programmatic use
         if args.phase == 'implementation':
             tasks = planner.parse_tasks_file()
-            batches = planner.create_execution_batches(tasks)
-            
             json_output = {
                 'phase': args.phase,
                 'spec_name': args.spec_name,
                 'total_tasks': len(tasks),
-                'batches': []
+                'batches': [
+                    {
+                        'batch_number': batch.batch_number,
+                        'can_parallel': batch.can_parallel,
+                        'tasks': [
+                            {
+                                'id': task.id,
+                                'description': task.description,
+                                'agent': task.agent,
+                                'command': task.command,
+                                'dependencies': task.dependencies
+                            }
+                            for task in batch.tasks
+                        ]
+                    }
+                    for batch in planner.iter_execution_batches(tasks)
+                ]
             }
             
-            for batch in batches:
-                json_output['batches'].append({
-                    'batch_number': batch.batch_number,
-                    'can_parallel': batch.can_parallel,
-                    'tasks': [
-                        {
-                            'id': task.id,
-                            'description': task.description,
-                            'agent': task.agent,
-                            'command': task.command,
-                            'dependencies': task.dependencies
-                        }
-                        for task in batch.tasks
-                    ]
-                })
-            
-            print(json.dumps(json_output, indent=2))
+            # Stream straight to stdout rather than building the full string
+            json.dump(json_output, sys.stdout, indent=2)
+            sys.stdout.write('\n')
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
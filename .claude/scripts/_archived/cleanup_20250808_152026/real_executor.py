@@ -125,7 +125,7 @@ class RealClaudeExecutor:
                 raise ValueError(f"Invalid or potentially unsafe command: {command}")
             
             # Execute the actual Claude Code command with process group
-            process = await self._create_safe_subprocess(f'claude-code "{command}"')
+            process = await self._create_safe_subprocess('claude-code', command)
             
             try:
                 stdout, stderr = await asyncio.wait_for(
@@ -291,25 +291,27 @@ class RealClaudeExecutor:
                 command=primary_command
             )
     
-    async def _create_safe_subprocess(self, command: str):
+    async def _create_safe_subprocess(self, *args: str):
         """Create subprocess with safe termination support"""
         if platform.system() == 'Windows':
-            # Windows process creation
+            # Windows process creation; the shell resolves .cmd shims such as claude-code
             return await asyncio.create_subprocess_shell(
-                command,
+                subprocess.list2cmdline(args),
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 cwd=self.project_root,
                 creationflags=subprocess.CREATE_NEW_PROCESS_GROUP
             )
         else:
-            # Unix-like systems with process group
-            return await asyncio.create_subprocess_shell(
-                command,
+            # Unix-like systems: exec directly, skipping an intermediate /bin/sh,
+            # in a new session (setsid) so the whole group can be signalled;
+            # start_new_session avoids running Python in the forked child
+            return await asyncio.create_subprocess_exec(
+                *args,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 cwd=self.project_root,
-                preexec_fn=os.setsid
+                start_new_session=True
             )
     
     async def _safe_terminate_process(self, process):
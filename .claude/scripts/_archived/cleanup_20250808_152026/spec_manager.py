@@ -3,13 +3,29 @@
 Comprehensive spec lifecycle management
 """
 
+import os
+import errno
 import json
-import re
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# _meta.json (de)serialization on bytes: orjson when installed, stdlib otherwise
+if orjson is not None:
+    def _dumps_meta(metadata: Dict) -> bytes:
+        return orjson.dumps(metadata, option=orjson.OPT_INDENT_2)
+    _loads_meta = orjson.loads
+else:
+    def _dumps_meta(metadata: Dict) -> bytes:
+        return json.dumps(metadata, indent=2, ensure_ascii=False).encode('utf-8')
+    _loads_meta = json.loads
+
 class SpecStage(Enum):
     BACKLOG = "backlog"
     SCOPE = "scope" 
@@ -17,10 +33,116 @@ class SpecStage(Enum):
     SANDBOX = "sandbox"
     ARCHIVED = "archived"
 
+# Allowed metadata values, built once for membership checks
+_VALID_STAGES = frozenset(stage.value for stage in SpecStage)
+_VALID_PRIORITIES = frozenset(('low', 'medium', 'high', 'critical'))
+
+# Templates for files scaffolded by create_spec
+_OVERVIEW_TPL = """# {title}
+
+**Status**: {status}  
+**Created**: {created}  
+**Description**: {description}
+
+## Overview
+{description}
+
+## Success Criteria
+- [ ] Define clear success criteria
+- [ ] Establish measurable outcomes
+- [ ] Set completion timeline
+
+## Next Steps
+Based on current stage ({stage}):
+{next_steps}"""
+
+_NEXT_STEPS = {
+    SpecStage.BACKLOG: """
+- [ ] Refine requirements and scope
+- [ ] Estimate effort and timeline
+- [ ] Prioritize against other backlog items
+""",
+    SpecStage.SCOPE: """
+- [ ] Create detailed requirements
+- [ ] Design technical architecture
+- [ ] Break down into implementation tasks
+""",
+}
+
+_DEFAULT_NEXT_STEPS = """
+- [ ] Review current status
+- [ ] Update documentation
+- [ ] Plan next actions
+"""
+
+_README_TPL = """# {name}
+
+Quick reference for the {name} specification.
+
+**Stage**: {stage}  
+**Description**: {description}  
+**Created**: {created}
+
+## Files
+- `overview.md` - Feature overview and success criteria
+- `_meta.json` - Specification metadata and tracking
+- `requirements.md` - Detailed requirements (created when moved to scope)
+- `design.md` - Technical design (created during design phase)
+- `tasks.md` - Implementation tasks (created during task breakdown)
+
+## Quick Commands
+```bash
+# View status
+python .claude/scripts/spec_manager.py status
+
+# Promote to next stage
+python .claude/scripts/spec_manager.py promote {name} --to=scope
+
+# Update metadata
+# Edit _meta.json directly or use promotion commands
+```
+"""
+
+def _move_path(src: Path, dst: Path):
+    """Move a file or directory, renaming in place when src and dst share a filesystem"""
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        import shutil
+        shutil.move(str(src), str(dst))
+
+def _dir_names(path) -> frozenset:
+    """Names in a directory from one scandir, empty if it can't be listed"""
+    try:
+        with os.scandir(path) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+def _is_task_header(line: str) -> bool:
+    """True for '#### Task <n>:' headings"""
+    number, sep, _ = line[len('#### Task '):].partition(':')
+    return line.startswith('#### Task ') and sep == ':' and number.isdecimal()
+
+def _is_valid_choice(value, choices: frozenset) -> bool:
+    """Set membership that tolerates unhashable values from malformed metadata"""
+    return isinstance(value, str) and value in choices
+
+# Directories ensure_structure creates directly under the specs root
+_STRUCTURE_NAMES = frozenset([stage.value for stage in SpecStage] + ['_meta'])
+
 class SpecManager:
+    # Absolute specs roots whose directory tree was already created in this process
+    _structure_ready: set = set()
+    
     def __init__(self):
         self.specs_root = Path('.claude/specs')
         self.meta_dir = self.specs_root / '_meta'
+        self._stage_dirs: Dict[SpecStage, Path] = {
+            stage: self.specs_root / stage.value for stage in SpecStage
+        }
         self.ensure_structure()
         
         # Required metadata fields
@@ -28,27 +150,64 @@ class SpecManager:
             'name', 'description', 'stage', 'created', 'updated',
             'completion_rate', 'priority', 'version'
         ]
+        self._required_set = frozenset(self.required_metadata_fields)
         
         # Valid priority values
         self.valid_priorities = ['low', 'medium', 'high', 'critical']
+        
+        # Parsed _meta.json contents: path -> ((mtime_ns, size), metadata)
+        self._meta_cache: Dict[Path, tuple] = {}
+        
+        # Spec name -> (stage, path), rebuilt when a stage dir mtime changes
+        self._spec_index: Optional[Dict[str, tuple]] = None
+        self._index_mtimes: Dict[SpecStage, int] = {}
+    
+    def _load_meta(self, meta_file: Path) -> Dict:
+        """Load _meta.json, reusing the cached parse while the file is unchanged.
+        
+        Returns a shallow copy so callers can add keys without touching the cache.
+        """
+        st = meta_file.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._meta_cache.get(meta_file)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, _loads_meta(meta_file.read_bytes()))
+            self._meta_cache[meta_file] = cached
+        return dict(cached[1])
+    
+    def _store_meta(self, meta_file: Path, metadata: Dict):
+        """Write _meta.json and refresh its cache entry"""
+        meta_file.write_bytes(_dumps_meta(metadata))
+        st = meta_file.stat()
+        self._meta_cache[meta_file] = ((st.st_mtime_ns, st.st_size), dict(metadata))
     
     def ensure_structure(self):
         """Ensure proper directory structure exists"""
-        for stage in SpecStage:
-            (self.specs_root / stage.value).mkdir(parents=True, exist_ok=True)
+        root_key = os.path.abspath(self.specs_root)
+        # One listing confirms the cached tree still exists; stage dirs may
+        # have been removed since (tests, cleanup scripts)
+        if root_key in SpecManager._structure_ready:
+            if _dir_names(self.specs_root) >= _STRUCTURE_NAMES:
+                return
+            SpecManager._structure_ready.discard(root_key)
+        for stage_dir in self._stage_dirs.values():
+            stage_dir.mkdir(parents=True, exist_ok=True)
         self.meta_dir.mkdir(parents=True, exist_ok=True)
+        SpecManager._structure_ready.add(root_key)
     
     def validate_metadata(self, metadata: Dict) -> List[str]:
         """Validate metadata completeness and correctness"""
         issues = []
         
-        # Check required fields
-        for field in self.required_metadata_fields:
-            if field not in metadata:
-                issues.append(f"Missing required field: {field}")
+        # Check required fields; one set comparison in the common complete case,
+        # and report any gaps in the declared field order
+        if not self._required_set <= metadata.keys():
+            for field in self.required_metadata_fields:
+                if field not in metadata:
+                    issues.append(f"Missing required field: {field}")
         
         # Validate specific fields
-        if 'priority' in metadata and metadata['priority'] not in self.valid_priorities:
+        if 'priority' in metadata and not _is_valid_choice(metadata['priority'], _VALID_PRIORITIES):
             issues.append(f"Invalid priority: {metadata['priority']}. Must be one of: {', '.join(self.valid_priorities)}")
         
         if 'completion_rate' in metadata:
@@ -56,7 +215,7 @@ class SpecManager:
             if not isinstance(rate, (int, float)) or rate < 0 or rate > 1:
                 issues.append(f"Invalid completion_rate: {rate}. Must be between 0 and 1")
         
-        if 'stage' in metadata and metadata['stage'] not in [s.value for s in SpecStage]:
+        if 'stage' in metadata and not _is_valid_choice(metadata['stage'], _VALID_STAGES):
             issues.append(f"Invalid stage: {metadata['stage']}")
         
         return issues
@@ -64,17 +223,18 @@ class SpecManager:
     def validate_spec_structure(self, spec_dir: Path) -> List[str]:
         """Validate that spec has required structure"""
         issues = []
+        names = _dir_names(spec_dir)
         
         required_files = ['overview.md', '_meta.json', 'README.md']
         for file in required_files:
-            if not (spec_dir / file).exists():
+            if file not in names:
                 issues.append(f"Missing required file: {file}")
         
         # Check metadata content
         meta_file = spec_dir / '_meta.json'
-        if meta_file.exists():
+        if '_meta.json' in names:
             try:
-                metadata = json.loads(meta_file.read_text())
+                metadata = self._load_meta(meta_file)
                 metadata_issues = self.validate_metadata(metadata)
                 issues.extend(metadata_issues)
             except json.JSONDecodeError:
@@ -86,23 +246,29 @@ class SpecManager:
     
     def create_spec(self, name: str, description: str, stage: SpecStage = SpecStage.BACKLOG) -> bool:
         """Create new specification with complete metadata and error handling"""
-        spec_dir = self.specs_root / stage.value / name
+        spec_dir = self._stage_dirs[stage] / name
         
         if spec_dir.exists():
             print(f"[ERROR] Spec '{name}' already exists in {stage.value}")
             return False
         
         try:
+            # One timestamp for metadata and templates
+            now = datetime.now()
+            iso = now.isoformat()
+            ymd = now.strftime('%Y-%m-%d')
+            
             # Create directory with parents
             spec_dir.mkdir(parents=True, exist_ok=True)
+            self._spec_index = None
             
             # Create COMPLETE metadata with all required fields
             metadata = {
                 'name': name,
                 'description': description,
                 'stage': stage.value,
-                'created': datetime.now().isoformat(),
-                'updated': datetime.now().isoformat(),
+                'created': iso,
+                'updated': iso,
                 'completion_rate': 0.0,
                 'priority': 'medium',
                 'tags': [],
@@ -112,80 +278,27 @@ class SpecManager:
             }
             
             # Write metadata with error handling
-            (spec_dir / '_meta.json').write_text(
-                json.dumps(metadata, indent=2), 
-                encoding='utf-8'
-            )
+            self._store_meta(spec_dir / '_meta.json', metadata)
             
             # Create overview with better template
-            overview_content = f"""# {name.replace('-', ' ').title()}
-
-**Status**: {stage.value.title()}  
-**Created**: {datetime.now().strftime('%Y-%m-%d')}  
-**Description**: {description}
-
-## Overview
-{description}
-
-## Success Criteria
-- [ ] Define clear success criteria
-- [ ] Establish measurable outcomes
-- [ ] Set completion timeline
-
-## Next Steps
-Based on current stage ({stage.value}):
-"""
-            
-            if stage == SpecStage.BACKLOG:
-                overview_content += """
-- [ ] Refine requirements and scope
-- [ ] Estimate effort and timeline
-- [ ] Prioritize against other backlog items
-"""
-            elif stage == SpecStage.SCOPE:
-                overview_content += """
-- [ ] Create detailed requirements
-- [ ] Design technical architecture
-- [ ] Break down into implementation tasks
-"""
-            else:
-                overview_content += """
-- [ ] Review current status
-- [ ] Update documentation
-- [ ] Plan next actions
-"""
-            
-            (spec_dir / 'overview.md').write_text(overview_content, encoding='utf-8')
+            overview_content = _OVERVIEW_TPL.format(
+                title=name.replace('-', ' ').title(),
+                status=stage.value.title(),
+                created=ymd,
+                description=description,
+                stage=stage.value,
+                next_steps=_NEXT_STEPS.get(stage, _DEFAULT_NEXT_STEPS)
+            )
+            (spec_dir / 'overview.md').write_bytes(overview_content.encode('utf-8'))
             
             # Create comprehensive README
-            readme_content = f"""# {name}
-
-Quick reference for the {name} specification.
-
-**Stage**: {stage.value}  
-**Description**: {description}  
-**Created**: {datetime.now().strftime('%Y-%m-%d')}
-
-## Files
-- `overview.md` - Feature overview and success criteria
-- `_meta.json` - Specification metadata and tracking
-- `requirements.md` - Detailed requirements (created when moved to scope)
-- `design.md` - Technical design (created during design phase)
-- `tasks.md` - Implementation tasks (created during task breakdown)
-
-## Quick Commands
-```bash
-# View status
-python .claude/scripts/spec_manager.py status
-
-# Promote to next stage
-python .claude/scripts/spec_manager.py promote {name} --to=scope
-
-# Update metadata
-# Edit _meta.json directly or use promotion commands
-```
-"""
-            (spec_dir / 'README.md').write_text(readme_content, encoding='utf-8')
+            readme_content = _README_TPL.format(
+                name=name,
+                stage=stage.value,
+                description=description,
+                created=ymd
+            )
+            (spec_dir / 'README.md').write_bytes(readme_content.encode('utf-8'))
             
             # Update dashboard with error handling
             try:
@@ -227,8 +340,14 @@ python .claude/scripts/spec_manager.py promote {name} --to=scope
             return False
         
         # Move spec
-        new_path = self.specs_root / to_stage.value / name
-        spec_path.rename(new_path)
+        new_path = self._stage_dirs[to_stage] / name
+        _move_path(spec_path, new_path)
+        self._spec_index = None
+        
+        # A rename keeps mtime and size, so a cached parse stays valid at the new path
+        cached = self._meta_cache.pop(spec_path / '_meta.json', None)
+        if cached is not None:
+            self._meta_cache[new_path / '_meta.json'] = cached
         
         # Update metadata
         self.update_spec_metadata(new_path, to_stage, reason)
@@ -239,13 +358,37 @@ python .claude/scripts/spec_manager.py promote {name} --to=scope
         print(f"Promoted '{name}': {current_stage.value} -> {to_stage.value}")
         return True
     
+    def _refresh_index(self) -> Dict[str, tuple]:
+        """Return the spec name index, rescanning if any stage dir changed"""
+        mtimes = {}
+        for stage, stage_dir in self._stage_dirs.items():
+            try:
+                mtimes[stage] = os.stat(stage_dir).st_mtime_ns
+            except FileNotFoundError:
+                mtimes[stage] = None
+        
+        if self._spec_index is None or mtimes != self._index_mtimes:
+            index = {}
+            for stage, stage_dir in self._stage_dirs.items():
+                if mtimes[stage] is None:
+                    continue
+                with os.scandir(stage_dir) as entries:
+                    for entry in entries:
+                        # Earlier stages win, matching the SpecStage walk order
+                        index.setdefault(entry.name, (stage, stage_dir / entry.name))
+            self._spec_index = index
+            self._index_mtimes = mtimes
+        return self._spec_index
+    
     def find_spec(self, name: str) -> Optional[tuple]:
         """Find spec in any stage"""
-        for stage in SpecStage:
-            spec_path = self.specs_root / stage.value / name
-            if spec_path.exists():
-                return (stage, spec_path)
-        return None
+        if os.sep in name or (os.altsep and os.altsep in name):
+            for stage, stage_dir in self._stage_dirs.items():
+                spec_path = stage_dir / name
+                if spec_path.exists():
+                    return (stage, spec_path)
+            return None
+        return self._refresh_index().get(name)
     
     def validate_promotion(self, spec_path: Path, from_stage: SpecStage, to_stage: SpecStage) -> bool:
         """Validate if promotion is allowed"""
@@ -258,13 +401,13 @@ python .claude/scripts/spec_manager.py promote {name} --to=scope
             
             try:
                 tasks_content = tasks_file.read_text(encoding='utf-8')
-                completed_tasks = tasks_content.count('✅')
                 total_tasks = tasks_content.count('#### Task')
                 
                 if total_tasks == 0:
                     print(f"Cannot promote to completed: no tasks defined")
                     return False
                 
+                completed_tasks = tasks_content.count('\u2705')  # ✅
                 completion_rate = completed_tasks / total_tasks
                 if completion_rate < 0.9:
                     print(f"Cannot promote to completed: only {completion_rate:.0%} tasks complete (need >90%)")
@@ -278,9 +421,9 @@ python .claude/scripts/spec_manager.py promote {name} --to=scope
     def update_spec_metadata(self, spec_path: Path, new_stage: SpecStage, reason: str):
         """Update spec metadata"""
         meta_file = spec_path / '_meta.json'
-        if meta_file.exists():
-            metadata = json.loads(meta_file.read_text())
-        else:
+        try:
+            metadata = self._load_meta(meta_file)
+        except FileNotFoundError:
             metadata = {}
         
         metadata.update({
@@ -289,35 +432,56 @@ python .claude/scripts/spec_manager.py promote {name} --to=scope
             'promotion_reason': reason
         })
         
-        meta_file.write_text(json.dumps(metadata, indent=2))
+        self._store_meta(meta_file, metadata)
     
     def get_status_overview(self) -> Dict:
         """Get comprehensive status overview"""
-        overview = {}
+        overview = {stage.value: {'count': 0, 'specs': []} for stage in SpecStage}
         
-        for stage in SpecStage:
-            stage_dir = self.specs_root / stage.value
-            specs = []
-            
-            if stage_dir.exists():
-                for spec_dir in stage_dir.iterdir():
-                    if spec_dir.is_dir() and not spec_dir.name.startswith('_'):
-                        spec_info = self.get_spec_info(spec_dir)
-                        specs.append(spec_info)
-            
-            overview[stage.value] = {
-                'count': len(specs),
-                'specs': specs
-            }
+        # Walk the specs root once and dispatch each stage directory found;
+        # scandir yields the entry type with the name, no stat per entry
+        try:
+            with os.scandir(self.specs_root) as stage_entries:
+                stage_paths = [entry.path for entry in stage_entries
+                               if entry.name in overview and entry.is_dir()]
+        except FileNotFoundError:
+            stage_paths = []
+        
+        spec_stages = []
+        spec_dirs = []
+        for stage_path in stage_paths:
+            stage_name = os.path.basename(stage_path)
+            with os.scandir(stage_path) as entries:
+                for entry in entries:
+                    if entry.is_dir() and not entry.name.startswith('_'):
+                        spec_stages.append(stage_name)
+                        spec_dirs.append(Path(entry.path))
+        
+        # get_spec_info is independent file I/O per spec, so read specs
+        # concurrently; each worker touches a distinct _meta_cache key
+        if len(spec_dirs) > 1:
+            workers = min(32, (os.cpu_count() or 1) * 4, len(spec_dirs))
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                spec_infos = list(executor.map(self.get_spec_info, spec_dirs))
+        else:
+            spec_infos = [self.get_spec_info(spec_dir) for spec_dir in spec_dirs]
+        
+        for stage_name, spec_info in zip(spec_stages, spec_infos):
+            overview[stage_name]['specs'].append(spec_info)
+        
+        for stage_data in overview.values():
+            stage_data['count'] = len(stage_data['specs'])
         
         return overview
     
     def get_spec_info(self, spec_dir: Path) -> Dict:
         """Get detailed spec information"""
+        names = _dir_names(spec_dir)
         meta_file = spec_dir / '_meta.json'
         
-        if meta_file.exists():
-            metadata = json.loads(meta_file.read_text())
+        if '_meta.json' in names:
+            metadata = self._load_meta(meta_file)
         else:
             metadata = {}
         
@@ -326,29 +490,30 @@ python .claude/scripts/spec_manager.py promote {name} --to=scope
         
         # Calculate completion rate
         tasks_file = spec_dir / 'tasks.md'
-        if tasks_file.exists():
+        if 'tasks.md' in names:
             try:
                 tasks_content = tasks_file.read_text(encoding='utf-8')
                 
-                # Find all task headers and their completion status
-                import re
-                task_pattern = r'#### Task \d+:.*?\n(?:.*?\n)*?(?=#### Task|\Z)'
-                tasks = re.findall(task_pattern, tasks_content, re.DOTALL)
-                
-                total_tasks = len(tasks)
+                # Single pass: a '#### Task' heading closes the current task,
+                # and only '#### Task <n>:' headings open a new one
+                total_tasks = 0
                 completed_tasks = 0
+                in_task = False
+                task_done = False
                 
-                for task in tasks:
-                    # Count tasks with completion markers
-                    # Check for ✅ in task headers or status lines
-                    task_lines = task.split('\n')
-                    for line in task_lines:
-                        if line.startswith('**Status:**') and ('✅' in line or 'completed' in line.lower()):
+                for line in tasks_content.splitlines():
+                    if line.startswith('#### Task'):
+                        if in_task and task_done:
                             completed_tasks += 1
-                            break
-                        elif line.startswith('#### Task') and '✅' in line:
-                            completed_tasks += 1
-                            break
+                        in_task = _is_task_header(line)
+                        total_tasks += in_task
+                        # Check for ✅ in task headers or status lines
+                        task_done = in_task and '✅' in line
+                    elif in_task and not task_done and line.startswith('**Status:**'):
+                        task_done = '✅' in line or 'completed' in line.lower()
+                
+                if in_task and task_done:
+                    completed_tasks += 1
                 
                 completion_rate = completed_tasks / total_tasks if total_tasks > 0 else 0
                 
@@ -359,62 +524,76 @@ python .claude/scripts/spec_manager.py promote {name} --to=scope
             completion_rate = 0
         
         metadata['completion_rate'] = completion_rate
-        metadata['has_requirements'] = (spec_dir / 'requirements.md').exists()
-        metadata['has_design'] = (spec_dir / 'design.md').exists()
-        metadata['has_tasks'] = tasks_file.exists()
+        metadata['has_requirements'] = 'requirements.md' in names
+        metadata['has_design'] = 'design.md' in names
+        metadata['has_tasks'] = 'tasks.md' in names
         
         return metadata
     
+    def _list_stage(self, stage: SpecStage) -> List[Path]:
+        """List spec directories in a stage without reading their contents"""
+        try:
+            with os.scandir(self._stage_dirs[stage]) as entries:
+                return [Path(entry.path) for entry in entries
+                        if entry.is_dir() and not entry.name.startswith('_')]
+        except FileNotFoundError:
+            return []
+    
     def update_dashboard(self):
         """Update the status dashboard with error handling"""
         try:
-            overview = self.get_status_overview()
+            # Only the specs actually rendered get their info loaded; the
+            # other stages just need a directory count
+            stage_specs = {stage.value: self._list_stage(stage) for stage in SpecStage}
+            counts = {stage: len(dirs) for stage, dirs in stage_specs.items()}
+            scope_specs = [self.get_spec_info(d) for d in stage_specs['scope']]
+            backlog_specs = [self.get_spec_info(d) for d in stage_specs['backlog'][:5]]
             
             # Ensure meta directory exists
             self.meta_dir.mkdir(parents=True, exist_ok=True)
             
-            dashboard_content = f"""# 📊 Specs Status Dashboard
+            parts = [f"""# 📊 Specs Status Dashboard
 *Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
 
 ## Overview
 ```
-📋 Backlog:    {overview['backlog']['count']} specs
-🎯 In Scope:   {overview['scope']['count']} specs
-✅ Completed:  {overview['completed']['count']} specs
-🧪 Sandbox:    {overview['sandbox']['count']} specs
-❄️ Archived:   {overview['archived']['count']} specs
+📋 Backlog:    {counts['backlog']} specs
+🎯 In Scope:   {counts['scope']} specs
+✅ Completed:  {counts['completed']} specs
+🧪 Sandbox:    {counts['sandbox']} specs
+❄️ Archived:   {counts['archived']} specs
 ```
 
 ## 🎯 Active Development (Scope)
-"""
+"""]
             
-            for spec in overview['scope']['specs']:
+            for spec in scope_specs:
                 completion = spec.get('completion_rate', 0)
                 name = spec.get('name', 'Unknown')
-                dashboard_content += f"- **{name}**: {completion:.0%} complete\n"
+                parts.append(f"- **{name}**: {completion:.0%} complete\n")
             
-            if not overview['scope']['specs']:
-                dashboard_content += "*No specs currently in scope*\n"
+            if not scope_specs:
+                parts.append("*No specs currently in scope*\n")
             
-            dashboard_content += "\n## 📋 Next Up (Backlog)\n"
+            parts.append("\n## 📋 Next Up (Backlog)\n")
             
-            for spec in overview['backlog']['specs'][:5]:  # Show top 5
+            for spec in backlog_specs:  # Show top 5
                 name = spec.get('name', 'Unknown')
                 description = spec.get('description', 'No description')
-                dashboard_content += f"- **{name}**: {description}\n"
+                parts.append(f"- **{name}**: {description}\n")
             
-            if len(overview['backlog']['specs']) > 5:
-                dashboard_content += f"- *...and {len(overview['backlog']['specs']) - 5} more*\n"
+            if counts['backlog'] > 5:
+                parts.append(f"- *...and {counts['backlog'] - 5} more*\n")
             
-            dashboard_content += f"""
+            parts.append(f"""
 ## 📈 Metrics
-- **Total Specs**: {sum(stage['count'] for stage in overview.values())}
-- **Active Work**: {overview['scope']['count']} specs
-- **Completion Rate**: {len([s for s in overview['scope']['specs'] if s.get('completion_rate', 0) > 0.5])} / {overview['scope']['count']} specs >50% complete
-"""
+- **Total Specs**: {sum(counts.values())}
+- **Active Work**: {counts['scope']} specs
+- **Completion Rate**: {len([s for s in scope_specs if s.get('completion_rate', 0) > 0.5])} / {counts['scope']} specs >50% complete
+""")
             
             dashboard_file = self.meta_dir / 'status-dashboard.md'
-            dashboard_file.write_text(dashboard_content, encoding='utf-8')
+            dashboard_file.write_bytes(''.join(parts).encode('utf-8'))
             
         except Exception as e:
             print(f"Warning: Could not update dashboard: {e}")
@@ -469,9 +648,9 @@ class SpecTransaction:
     
     def move_spec(self, from_path: Path, to_path: Path):
         """Move spec with rollback capability"""
-        from_path.rename(to_path)
+        _move_path(from_path, to_path)
         self.moved_items.append((from_path, to_path))
-        self.rollback_actions.append(lambda: to_path.rename(from_path))
+        self.rollback_actions.append(lambda: _move_path(to_path, from_path))
 
 # CLI Interface
 if __name__ == "__main__":
@@ -3,11 +3,14 @@
 Migrate existing specs to new structured organization
 """
 
+import os
 import shutil
 from pathlib import Path
 import json
 from datetime import datetime
 
+from spec_manager import _dir_names
+
 class SpecMigrator:
     def __init__(self):
         self.specs_root = Path('.claude/specs')
@@ -26,22 +29,26 @@ class SpecMigrator:
         # Skip structure directories
         structure_dirs = {'backlog', 'scope', 'completed', 'sandbox', 'archived', '_meta'}
         
-        for spec_dir in self.specs_root.iterdir():
-            if spec_dir.is_dir() and spec_dir.name not in structure_dirs:
-                spec_info = self.analyze_spec(spec_dir)
-                existing_specs.append(spec_info)
+        with os.scandir(self.specs_root) as entries:
+            for entry in entries:
+                if entry.is_dir() and entry.name not in structure_dirs:
+                    spec_info = self.analyze_spec(entry.path)
+                    existing_specs.append(spec_info)
         
         return existing_specs
     
     def analyze_spec(self, spec_dir):
         """Analyze individual spec to determine its status"""
-        spec_name = spec_dir.name
+        # Work on the plain path string; a Path is only built for the result
+        spec_dir = os.fspath(spec_dir)
+        spec_name = os.path.basename(spec_dir)
+        names = _dir_names(spec_dir)
         
         # Check for completion indicators
-        tasks_file = spec_dir / 'tasks.md'
-        if tasks_file.exists():
+        if 'tasks.md' in names:
             try:
-                tasks_content = tasks_file.read_text(encoding='utf-8')
+                with open(os.path.join(spec_dir, 'tasks.md'), encoding='utf-8') as f:
+                    tasks_content = f.read()
                 completed_tasks = tasks_content.count('✅')
                 total_tasks = tasks_content.count('#### Task')
                 completion_rate = completed_tasks / total_tasks if total_tasks > 0 else 0
@@ -63,12 +70,12 @@ class SpecMigrator:
         
         return {
             'name': spec_name,
-            'path': spec_dir,
+            'path': Path(spec_dir),
             'completion_rate': completion_rate,
             'suggested_category': suggested_category,
-            'has_tasks': tasks_file.exists(),
-            'has_requirements': (spec_dir / 'requirements.md').exists(),
-            'has_design': (spec_dir / 'design.md').exists()
+            'has_tasks': 'tasks.md' in names,
+            'has_requirements': 'requirements.md' in names,
+            'has_design': 'design.md' in names
         }
     
     def migrate_specs(self, categorization_plan):
@@ -113,39 +120,44 @@ class SpecMigrator:
         # Create status dashboard
         self.create_status_dashboard()
     
+    def _count_entries(self, category):
+        """Count entries in a category directory without building a list"""
+        with os.scandir(self.specs_root / category) as entries:
+            return sum(1 for _ in entries)
+    
+    def _spec_names(self, category):
+        """List spec directory names in a category, empty if it is missing"""
+        try:
+            with os.scandir(os.path.join(self.specs_root, category)) as entries:
+                return [entry.name for entry in entries if entry.is_dir()]
+        except FileNotFoundError:
+            return []
+    
     def create_status_dashboard(self):
         """Create a visual status dashboard"""
-        dashboard_content = f"""# Specs Status Dashboard
+        parts = [f"""# Specs Status Dashboard
 *Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}*
 
 ## Overview
 ```
-Backlog:    {len(list((self.specs_root / 'backlog').iterdir()))} specs
-In Scope:   {len(list((self.specs_root / 'scope').iterdir()))} specs  
-Completed:  {len(list((self.specs_root / 'completed').iterdir()))} specs
-Sandbox:    {len(list((self.specs_root / 'sandbox').iterdir()))} specs
+Backlog:    {self._count_entries('backlog')} specs
+In Scope:   {self._count_entries('scope')} specs  
+Completed:  {self._count_entries('completed')} specs
+Sandbox:    {self._count_entries('sandbox')} specs
 ```
 
 ## Active Development (Scope)
-"""
+"""]
         
         # Add active specs
-        scope_dir = self.specs_root / 'scope'
-        if scope_dir.exists():
-            for spec_dir in scope_dir.iterdir():
-                if spec_dir.is_dir():
-                    dashboard_content += f"- **{spec_dir.name}**: In progress\n"
+        parts.extend(f"- **{name}**: In progress\n" for name in self._spec_names('scope'))
         
-        dashboard_content += "\n## Next Up (Backlog)\n"
+        parts.append("\n## Next Up (Backlog)\n")
         
         # Add backlog specs  
-        backlog_dir = self.specs_root / 'backlog'
-        if backlog_dir.exists():
-            for spec_dir in backlog_dir.iterdir():
-                if spec_dir.is_dir():
-                    dashboard_content += f"- **{spec_dir.name}**: Ready for development\n"
+        parts.extend(f"- **{name}**: Ready for development\n" for name in self._spec_names('backlog'))
         
-        (self.specs_root / '_meta' / 'status-dashboard.md').write_text(dashboard_content)
+        (self.specs_root / '_meta' / 'status-dashboard.md').write_text(''.join(parts))
 
 if __name__ == "__main__":
     migrator = SpecMigrator()
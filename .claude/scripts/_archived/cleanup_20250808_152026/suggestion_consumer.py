@@ -5,13 +5,22 @@ Reads suggestions from hooks and executes them automatically
 """
 
 import asyncio
+import atexit
 import json
+import os
+import random
+import re
 import time
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, List
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 import sys
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent))
@@ -48,31 +57,200 @@ except ImportError as e:
     
     sys.exit(1)
 
+try:
+    from functools import cached_property
+except ImportError:  # Python < 3.8
+    class cached_property:
+        """Compute an attribute on first access and store it on the instance"""
+        def __init__(self, func):
+            self.func = func
+            self.__doc__ = func.__doc__
+        
+        def __get__(self, instance, owner=None):
+            if instance is None:
+                return self
+            value = instance.__dict__[self.func.__name__] = self.func(instance)
+            return value
+
+# Optional file watchers: inotify on Linux, watchdog elsewhere, polling otherwise
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import PatternMatchingEventHandler
+except ImportError:
+    Observer = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Used to tell whether the consumer that claimed a suggestion is still alive
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# JSON on bytes for log lines and settings: orjson when installed, stdlib otherwise.
+# Both write datetimes as isoformat(); orjson does it natively in C.
+if orjson is not None:
+    def _dumps_log_line(entry: Dict) -> bytes:
+        return orjson.dumps(entry, default=str, option=orjson.OPT_APPEND_NEWLINE)
+    _loads_json = orjson.loads
+else:
+    def _json_default(value):
+        return value.isoformat() if isinstance(value, datetime) else str(value)
+    
+    def _dumps_log_line(entry: Dict) -> bytes:
+        return json.dumps(entry, default=_json_default).encode('utf-8') + b'\n'
+    _loads_json = json.loads
+
+def _keyword_scanner(keywords: List[str]):
+    """Compile keywords into one regex that scans text for every start position.
+
+    The lookahead lets matches overlap, but each position reports only the
+    first listed keyword that starts there, so keywords must be passed in
+    priority order.
+    """
+    return re.compile('(?=(' + '|'.join(map(re.escape, keywords)) + '))')
+
+def _first_tier(scanner, tier_of: Dict[str, int], text: str) -> Optional[int]:
+    """Lowest tier index among the keywords found in text, in a single scan"""
+    return min((tier_of[match.group(1)] for match in scanner.finditer(text)), default=None)
+
+# Resource tiers in priority order; the first tier with a keyword in the command wins
+_REQUIREMENT_TIERS = [
+    (['orchestrate', 'master', 'workflow-auto'], dict(cpu_percent=40, memory_mb=1024, estimated_duration=1800)),
+    (['spec-tasks', 'planning', 'spec-design'], dict(cpu_percent=25, memory_mb=512, estimated_duration=600)),
+    (['spec-requirements', 'spec-create'], dict(cpu_percent=20, memory_mb=256, estimated_duration=300)),
+]
+_DEFAULT_REQUIREMENTS = dict(cpu_percent=15, memory_mb=256, estimated_duration=180)
+_REQUIREMENT_TIER_OF = {kw: i for i, (kws, _) in enumerate(_REQUIREMENT_TIERS) for kw in kws}
+_REQUIREMENT_SCANNER = _keyword_scanner(list(_REQUIREMENT_TIER_OF))
+
+# Workflow phases in priority order, matched case-sensitively
+_PHASE_TIERS = [
+    ('/spec-create', 'spec_creation'),
+    ('/spec-requirements', 'requirements_generation'),
+    ('/spec-design', 'design_creation'),
+    ('/spec-tasks', 'task_generation'),
+    ('implementation', 'implementation'),
+    ('/spec-review', 'validation'),
+]
+_PHASE_TIER_OF = {kw: i for i, (kw, _) in enumerate(_PHASE_TIERS)}
+_PHASE_SCANNER = _keyword_scanner(list(_PHASE_TIER_OF))
+
+# Whole words only, so e.g. "information" no longer trips the "format" check
+_SUSPICIOUS_RE = re.compile(r'rm\s+-rf|del\s+/s|\bformat\b|\bshutdown\b|\breboot\b', re.IGNORECASE)
+
+if hasattr(asyncio, 'timeout'):
+    async def _await_with_timeout(awaitable, timeout: float):
+        """Await with a deadline on the current task, no wrapper task (Python 3.11+)"""
+        async with asyncio.timeout(timeout):
+            return await awaitable
+else:
+    async def _await_with_timeout(awaitable, timeout: float):
+        """Await with a deadline via wait_for on older Pythons"""
+        return await asyncio.wait_for(awaitable, timeout=timeout)
+
+# Suggestions that failed every retry are kept for review, newest first
+_FAILED_SUGGESTIONS_KEPT = 20
+
+def _pid_alive(pid: int) -> bool:
+    """Whether a process id is still running (assumed alive when it can't be told)"""
+    if psutil is not None:
+        return psutil.pid_exists(pid)
+    if os.name == 'nt':
+        return True  # os.kill would terminate the process here
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+# Counters kept in the execution stats snapshot
+_STATS_COUNTERS = ('total_executions', 'successful_executions', 'failed_executions')
+
+# Upper bound in seconds for the jittered retry backoff
+_RETRY_DELAY_CAP = 60
+
+# Execution log entries are buffered and appended in one write per flush
+_LOG_FLUSH_ENTRIES = 32
+_LOG_FLUSH_SECONDS = 2.0
+
+_LOG_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+# Consumers that may still hold buffered log entries; weak so the exit hook
+# doesn't keep finished consumers alive
+_live_consumers = weakref.WeakSet()
+
+def _flush_live_consumers():
+    """Flush the execution log of every consumer still alive at exit"""
+    for consumer in list(_live_consumers):
+        consumer.flush_execution_log()
+
 class SuggestionConsumer:
     """Consumes command suggestions from hooks and executes them"""
     
+    # Set once this module's logger has its queued handlers
+    _logging_configured = False
+    
     def __init__(self, project_root: Path = None):
         self.project_root = project_root or self._find_project_root()
         self.claude_dir = self.project_root / '.claude'
         
-        # Core components
-        self.executor = RealClaudeExecutor(self.project_root)
-        self.resource_manager = ResourceManager(self.project_root)
-        self.state_manager = UnifiedStateManager()
-        
         # Configuration files
         self.suggestion_file = self.claude_dir / 'next_command.txt'
         self.config_file = self.claude_dir / 'settings.local.json'
         self.execution_log = self.claude_dir / 'logs' / 'sessions' / 'auto_execution.log'
         
+        # Suggestion claimed by check_for_suggestions and not yet settled
+        self._inflight_file: Optional[Path] = None
+        # Claims left behind by consumers that exited mid-execution, found on
+        # the first check and re-run before new suggestions
+        self._orphans: Optional[List[Path]] = None
+        self.stats_snapshot = self.execution_log.with_suffix('.stats')
+        
         # Execution settings
         self.auto_execution_enabled = True
         self.max_retries = 3
         self.retry_delay = 5  # seconds
+        self.max_concurrency = 1  # suggestions executed at once in continuous mode
+        
+        # Pending execution log lines, flushed by count, timer, or shutdown
+        self._log_buf: List[bytes] = []
+        self._log_fd: Optional[int] = None
+        self._log_flush_handle = None
+        self._log_flush_loop = None  # loop the flush timer was scheduled on
+        self._log_lock = threading.Lock()
+        self._log_writer: Optional[ThreadPoolExecutor] = None
+        
+        # (mtime_ns, size) of the settings file last parsed
+        self._config_stamp = None
         
         self.setup_logging()
+        _live_consumers.add(self)
         self.load_config()
         
+    # Core components, built on first use so --stats skips their setup
+    @cached_property
+    def executor(self) -> RealClaudeExecutor:
+        return RealClaudeExecutor(self.project_root)
+    
+    @cached_property
+    def resource_manager(self) -> ResourceManager:
+        return ResourceManager(self.project_root)
+    
+    @cached_property
+    def state_manager(self) -> UnifiedStateManager:
+        return UnifiedStateManager()
+    
     def _find_project_root(self) -> Path:
         """Find project root by looking for .claude directory"""
         current = Path.cwd()
@@ -83,33 +261,58 @@ class SuggestionConsumer:
         return Path.cwd()
     
     def setup_logging(self):
-        """Setup suggestion consumer logging"""
+        """Setup suggestion consumer logging once per process
+        
+        Records are queued and written by a listener thread so logging from the
+        event loop never waits on file I/O.
+        """
+        self.logger = logging.getLogger(__name__)
+        if SuggestionConsumer._logging_configured:
+            return
+        
         log_dir = self.claude_dir / 'logs' / 'execution'
         log_dir.mkdir(parents=True, exist_ok=True)
         
         log_file = log_dir / f'suggestion_consumer_{datetime.now().strftime("%Y%m%d")}.log'
         
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler()
-            ]
-        )
-        self.logger = logging.getLogger(__name__)
+        handlers = [logging.FileHandler(log_file), logging.StreamHandler()]
+        for handler in handlers:
+            handler.setFormatter(_LOG_FORMATTER)
+        
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, *handlers)
+        listener.start()
+        atexit.register(listener.stop)
+        # Registered after the listener so it runs first and its warnings still land
+        atexit.register(_flush_live_consumers)
+        
+        self.logger.addHandler(QueueHandler(log_queue))
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        SuggestionConsumer._logging_configured = True
     
     def load_config(self):
-        """Load configuration from settings file"""
-        if self.config_file.exists():
+        """Load configuration from settings file, skipping the parse if it is unchanged"""
+        try:
+            st = os.stat(self.config_file)
+        except FileNotFoundError:
+            self._config_stamp = None
+            return
+        except OSError as e:
+            self.logger.error(f"Error loading configuration: {e}")
+            return
+        
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp != self._config_stamp:
+            self._config_stamp = stamp
             try:
-                with open(self.config_file) as f:
-                    config = json.load(f)
+                config = _loads_json(self.config_file.read_bytes())
                 
                 workflow_config = config.get('workflow', {})
                 self.auto_execution_enabled = workflow_config.get('auto_progression', True)
                 self.max_retries = workflow_config.get('max_retries', 3)
                 self.retry_delay = workflow_config.get('retry_delay', 5)
+                self.max_concurrency = max(1, int(workflow_config.get('max_concurrent_suggestions', 1)))
                 
                 self.logger.info(f"Configuration loaded - Auto-execution: {self.auto_execution_enabled}")
                 
@@ -118,22 +321,116 @@ class SuggestionConsumer:
     
     async def check_for_suggestions(self) -> Optional[str]:
         """Check for command suggestions from hooks"""
-        if not self.suggestion_file.exists():
+        if self._orphans is None:
+            self._orphans = self._find_orphans()
+            self._prune_failed()
+        while self._orphans:
+            orphan = self._orphans.pop()
+            self.logger.warning(f"Re-running suggestion left by an interrupted consumer: {orphan.name}")
+            command = self._claim_suggestion(orphan)
+            if command:
+                return command
+        
+        return self._claim_suggestion(self.suggestion_file)
+    
+    def _find_orphans(self) -> List[Path]:
+        """Claimed suggestions whose consumer is gone, oldest last (popped first)"""
+        prefix = f"{self.suggestion_file.name}.inflight."
+        orphans = []
+        try:
+            with os.scandir(self.suggestion_file.parent) as entries:
+                for entry in entries:
+                    if not entry.name.startswith(prefix):
+                        continue
+                    # <pid>.<ns>; claims from before the pid was recorded are just <ns>
+                    owner = entry.name[len(prefix):].split('.')
+                    if len(owner) == 2 and owner[0].isdigit() and _pid_alive(int(owner[0])):
+                        continue
+                    orphans.append(Path(entry.path))
+        except OSError:
+            return []
+        orphans.sort(key=lambda path: path.name.rsplit('.', 1)[-1].zfill(20), reverse=True)
+        return orphans
+    
+    def _prune_failed(self):
+        """Keep only the newest failed suggestions"""
+        prefix = f"{self.suggestion_file.name}.failed."
+        try:
+            with os.scandir(self.suggestion_file.parent) as entries:
+                failed = sorted(
+                    (entry.path for entry in entries if entry.name.startswith(prefix)),
+                    key=lambda path: path.rsplit('.', 1)[-1].zfill(20),
+                    reverse=True
+                )
+            for path in failed[_FAILED_SUGGESTIONS_KEPT:]:
+                os.unlink(path)
+        except OSError as e:
+            self.logger.warning(f"Could not prune failed suggestions: {e}")
+    
+    def _claim_suggestion(self, source: Path) -> Optional[str]:
+        """Claim a suggestion file and read its command"""
+        # Claim the suggestion with an atomic rename so a hook can write the next
+        # one while this executes; a missing file costs one failed syscall. The
+        # name records this process so a later consumer can spot an orphaned claim.
+        inflight = self.suggestion_file.with_name(
+            f"{self.suggestion_file.name}.inflight.{os.getpid()}.{time.time_ns()}"
+        )
+        try:
+            os.replace(source, inflight)
+            fd = os.open(inflight, os.O_RDONLY)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.error(f"Error reading suggestion file: {e}")
             return None
         
+        command = None
         try:
-            command = self.suggestion_file.read_text().strip()
-            if command:
-                self.logger.info(f"Found suggested command: {command}")
-                return command
+            chunks = []
+            while True:
+                chunk = os.read(fd, 8192)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            command = b''.join(chunks).decode('utf-8', 'replace').strip()
         except Exception as e:
             self.logger.error(f"Error reading suggestion file: {e}")
+        finally:
+            os.close(fd)
+        
+        if command:
+            self._inflight_file = inflight
+            self.logger.info(f"Found suggested command: {command}")
+            return command
         
+        # Nothing runnable: drop an empty suggestion, keep an unreadable one for review
+        self._settle_inflight(inflight, command == '')
         return None
     
-    async def execute_suggestion(self, command: str) -> ExecutionResult:
+    def _take_inflight(self) -> Optional[Path]:
+        """Hand over the file claimed by the last check_for_suggestions call"""
+        inflight, self._inflight_file = self._inflight_file, None
+        return inflight
+    
+    def _settle_inflight(self, inflight: Optional[Path], succeeded: bool):
+        """Remove the claimed suggestion on success, or set it aside as .failed.<ts>"""
+        if inflight is None:
+            return
+        try:
+            if succeeded:
+                inflight.unlink()
+            else:
+                ns = inflight.name.rsplit('.', 1)[-1]
+                os.replace(inflight, inflight.with_name(f"{self.suggestion_file.name}.failed.{ns}"))
+                self._prune_failed()
+        except OSError as e:
+            self.logger.warning(f"Could not settle suggestion file {inflight.name}: {e}")
+    
+    async def execute_suggestion(self, command: str, command_lc: Optional[str] = None) -> ExecutionResult:
         """Execute a suggested command with enhanced resource management and error handling"""
         self.logger.info(f"🚀 Executing suggested command: {command}")
+        if command_lc is None:
+            command_lc = command.lower()
         
         # Validate command before execution
         if not self._validate_command_safety(command):
@@ -146,22 +443,23 @@ class SuggestionConsumer:
             )
         
         # Estimate resource requirements based on command type
-        requirements = self._estimate_requirements(command)
-        task_id = f"suggestion_{int(time.time())}"
+        requirements = self._estimate_requirements(command, command_lc)
+        # Monotonic ns: unique per suggestion, unlike the old 1s wall-clock stamp
+        task_id = f"suggestion_{time.monotonic_ns()}"
         
         try:
             # Try to acquire resources with timeout
-            resource_acquired = await asyncio.wait_for(
+            resource_acquired = await _await_with_timeout(
                 self.resource_manager.acquire_resources(task_id, "suggestion_consumer", requirements),
-                timeout=60.0  # 1 minute timeout for resource acquisition
+                60.0  # 1 minute timeout for resource acquisition
             )
             
             if resource_acquired:
                 try:
                     # Execute the command with timeout
-                    result = await asyncio.wait_for(
+                    result = await _await_with_timeout(
                         self.executor.execute_command(command),
-                        timeout=requirements.estimated_duration + 60  # Add buffer time
+                        requirements.estimated_duration + 60  # Add buffer time
                     )
                     
                     # Log execution with enhanced context
@@ -220,80 +518,125 @@ class SuggestionConsumer:
     def _validate_command_safety(self, command: str) -> bool:
         """Basic command safety validation for internal use"""
         # For internal dev use, mostly just log suspicious commands
-        suspicious_patterns = ['rm -rf', 'del /s', 'format', 'shutdown', 'reboot']
-        
-        for pattern in suspicious_patterns:
-            if pattern.lower() in command.lower():
-                self.logger.warning(f"Potentially dangerous command detected: {command}")
-                return False  # Block clearly dangerous commands
+        if _SUSPICIOUS_RE.search(command):
+            self.logger.warning(f"Potentially dangerous command detected: {command}")
+            return False  # Block clearly dangerous commands
         
         return True
     
-    def _estimate_requirements(self, command: str) -> ResourceRequirements:
+    def _estimate_requirements(self, command: str, command_lc: Optional[str] = None) -> ResourceRequirements:
         """Estimate resource requirements based on command type"""
         # Basic heuristics for resource estimation
-        if any(keyword in command.lower() for keyword in ['orchestrate', 'master', 'workflow-auto']):
-            return ResourceRequirements(cpu_percent=40, memory_mb=1024, estimated_duration=1800)
-        elif any(keyword in command.lower() for keyword in ['spec-tasks', 'planning', 'spec-design']):
-            return ResourceRequirements(cpu_percent=25, memory_mb=512, estimated_duration=600)
-        elif any(keyword in command.lower() for keyword in ['spec-requirements', 'spec-create']):
-            return ResourceRequirements(cpu_percent=20, memory_mb=256, estimated_duration=300)
-        else:
-            return ResourceRequirements(cpu_percent=15, memory_mb=256, estimated_duration=180)
+        if command_lc is None:
+            command_lc = command.lower()
+        tier = _first_tier(_REQUIREMENT_SCANNER, _REQUIREMENT_TIER_OF, command_lc)
+        if tier is None:
+            return ResourceRequirements(**_DEFAULT_REQUIREMENTS)
+        return ResourceRequirements(**_REQUIREMENT_TIERS[tier][1])
     
     async def _log_execution(self, command: str, result: ExecutionResult):
         """Enhanced execution logging with context and error details"""
         log_entry = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.now(),  # formatted by _dumps_log_line
             'command': command,
             'success': result.success,
             'duration': result.duration,
             'output_length': len(result.output) if result.output else 0,
             'error': result.error if result.error else None,
-            'agent_used': getattr(result, 'agent_used', None),
+            'agent_used': result.agent_used,
             'context': {
-                'concurrent_tasks': len(self.resource_manager.active_tasks) if hasattr(self.resource_manager, 'active_tasks') else 0,
-                'system_load': self.resource_manager.get_system_load() if hasattr(self.resource_manager, 'get_system_load') else None
+                'concurrent_tasks': len(self.resource_manager.active_tasks),
+                'system_load': self.resource_manager.get_system_load()
             }
         }
         
-        # Append to execution log with error handling
-        self.execution_log.parent.mkdir(parents=True, exist_ok=True)
+        self._log_buf.append(_dumps_log_line(log_entry))
         
+        if len(self._log_buf) >= _LOG_FLUSH_ENTRIES:
+            await self._flush_in_background()
+        else:
+            # A timer left on a loop from an earlier asyncio.run() never fires
+            # here, so schedule a fresh one on the current loop
+            loop = asyncio.get_running_loop()
+            if self._log_flush_handle is None or self._log_flush_loop is not loop:
+                self._log_flush_handle = loop.call_later(
+                    _LOG_FLUSH_SECONDS, self._flush_in_background)
+                self._log_flush_loop = loop
+    
+    def _flush_in_background(self) -> asyncio.Future:
+        """Hand buffered log entries to the writer thread, off the event loop"""
+        if self._log_flush_handle is not None:
+            self._log_flush_handle.cancel()
+            self._log_flush_handle = None
+        # A single worker keeps flushes in submission order
+        if self._log_writer is None:
+            self._log_writer = ThreadPoolExecutor(max_workers=1)
+        return asyncio.get_running_loop().run_in_executor(self._log_writer, self.flush_execution_log)
+    
+    def flush_execution_log(self):
+        """Append buffered execution log entries with a single write"""
+        with self._log_lock:
+            # Swap rather than clear: the event loop may append while this runs
+            buf, self._log_buf = self._log_buf, []
+            if buf:
+                self._write_log_data(b''.join(buf))
+    
+    def close(self):
+        """Flush pending log entries and release the log descriptor and writer thread"""
+        if self._log_flush_handle is not None:
+            self._log_flush_handle.cancel()
+            self._log_flush_handle = None
+        self.flush_execution_log()
+        if self._log_writer is not None:
+            self._log_writer.shutdown(wait=True)
+            self._log_writer = None
+        if self._log_fd is not None:
+            os.close(self._log_fd)
+            self._log_fd = None
+    
+    def _write_log_data(self, data: bytes):
+        """Write joined log lines to the execution log, or the fallback log on error"""
         try:
-            with open(self.execution_log, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(log_entry, default=str) + '\n')
+            if self._log_fd is None:
+                self.execution_log.parent.mkdir(parents=True, exist_ok=True)
+                self._log_fd = os.open(self.execution_log, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(self._log_fd, view):]
         except Exception as e:
             self.logger.error(f"Failed to write execution log: {e}")
             # Try to write to fallback location
             try:
                 fallback_log = self.claude_dir / 'logs' / 'execution_fallback.log'
-                with open(fallback_log, 'a', encoding='utf-8') as f:
-                    f.write(f"{datetime.now().isoformat()}: {command} - {result.success} - {result.error or 'No error'}\n")
+                with open(fallback_log, 'ab') as f:
+                    f.write(data)
             except:
                 pass  # Silent fallback failure
     
-    async def process_suggestion_with_retry(self, command: str) -> ExecutionResult:
+    async def process_suggestion_with_retry(self, command: str, inflight: Optional[Path] = None) -> ExecutionResult:
         """Process suggestion with retry logic"""
         last_result = None
+        command_lc = command.lower()
+        delay = self.retry_delay
         
         for attempt in range(self.max_retries):
             try:
-                result = await self.execute_suggestion(command)
+                result = await self.execute_suggestion(command, command_lc)
                 
                 if result.success:
                     self.logger.info(f"✅ Command executed successfully on attempt {attempt + 1}")
-                    # Remove suggestion file on success
-                    if self.suggestion_file.exists():
-                        self.suggestion_file.unlink()
+                    # Remove the claimed suggestion on success
+                    self._settle_inflight(inflight, True)
                     return result
                 else:
                     self.logger.warning(f"❌ Command failed on attempt {attempt + 1}: {result.error}")
                     last_result = result
                     
                     if attempt < self.max_retries - 1:
-                        self.logger.info(f"Retrying in {self.retry_delay} seconds...")
-                        await asyncio.sleep(self.retry_delay)
+                        self.logger.info(f"Retrying in {delay:.1f} seconds...")
+                        await asyncio.sleep(delay)
+                        # Decorrelated jitter: grow the wait but spread out competing consumers
+                        delay = min(_RETRY_DELAY_CAP, random.uniform(self.retry_delay, delay * 3))
                         
             except Exception as e:
                 self.logger.error(f"Exception during attempt {attempt + 1}: {e}")
@@ -305,6 +648,7 @@ class SuggestionConsumer:
         
         # All retries failed
         self.logger.error(f"Command failed after {self.max_retries} attempts")
+        self._settle_inflight(inflight, False)
         return last_result or ExecutionResult(
             success=False,
             error="Max retries exceeded",
@@ -313,6 +657,8 @@ class SuggestionConsumer:
     
     async def run_once(self) -> bool:
         """Check for and process one suggestion"""
+        # Pick up settings edits made while running continuously
+        self.load_config()
         if not self.auto_execution_enabled:
             return False
         
@@ -320,7 +666,12 @@ class SuggestionConsumer:
         if not command:
             return False
         
-        result = await self.process_suggestion_with_retry(command)
+        await self._process_claimed(command, self._take_inflight())
+        return True
+    
+    async def _process_claimed(self, command: str, inflight: Optional[Path]):
+        """Execute a claimed suggestion and record the outcome"""
+        result = await self.process_suggestion_with_retry(command, inflight)
         
         if result.success:
             self.logger.info("Suggestion processed successfully")
@@ -328,41 +679,98 @@ class SuggestionConsumer:
             await self._update_workflow_state(command, result)
         else:
             self.logger.error(f"Suggestion processing failed: {result.error}")
-        
-        return True
     
     async def _update_workflow_state(self, command: str, result: ExecutionResult):
         """Update workflow state based on command execution"""
         try:
             # Extract phase information from command
-            if '/spec-create' in command:
-                self.state_manager.update_workflow_phase('spec_creation')
-            elif '/spec-requirements' in command:
-                self.state_manager.update_workflow_phase('requirements_generation')
-            elif '/spec-design' in command:
-                self.state_manager.update_workflow_phase('design_creation')
-            elif '/spec-tasks' in command:
-                self.state_manager.update_workflow_phase('task_generation')
-            elif 'implementation' in command:
-                self.state_manager.update_workflow_phase('implementation')
-            elif '/spec-review' in command:
-                self.state_manager.update_workflow_phase('validation')
+            tier = _first_tier(_PHASE_SCANNER, _PHASE_TIER_OF, command)
+            if tier is not None:
+                self.state_manager.update_workflow_phase(_PHASE_TIERS[tier][1])
                 
         except Exception as e:
             self.logger.error(f"Error updating workflow state: {e}")
     
+    def _start_watcher(self) -> Optional[asyncio.Queue]:
+        """Watch the suggestion file for writes; returns a wakeup queue or None to poll"""
+        loop = asyncio.get_running_loop()
+        wakeups = asyncio.Queue()
+        name = self.suggestion_file.name
+        
+        def notify():
+            loop.call_soon_threadsafe(wakeups.put_nowait, None)
+        
+        self.claude_dir.mkdir(parents=True, exist_ok=True)
+        
+        if INotify is not None:
+            inotify = INotify()
+            inotify.add_watch(str(self.claude_dir), inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO)
+            
+            def watch_loop():
+                while True:
+                    if any(event.name == name for event in inotify.read()):
+                        notify()
+            
+            threading.Thread(target=watch_loop, daemon=True).start()
+            self.logger.info("Watching for suggestions with inotify")
+            return wakeups
+        
+        if Observer is not None:
+            handler = PatternMatchingEventHandler(patterns=[f'*{name}'])
+            handler.on_created = handler.on_modified = handler.on_moved = lambda event: notify()
+            observer = Observer()
+            observer.daemon = True
+            observer.schedule(handler, str(self.claude_dir), recursive=False)
+            observer.start()
+            self.logger.info("Watching for suggestions with watchdog")
+            return wakeups
+        
+        return None
+    
     async def run_continuous(self, check_interval: int = 10):
         """Run continuous suggestion monitoring"""
         self.logger.info(f"Starting continuous suggestion monitoring (interval: {check_interval}s)")
         
+        try:
+            wakeups = self._start_watcher()
+            if self.max_concurrency > 1:
+                await self._run_concurrent(wakeups, check_interval)
+                return
+            if wakeups is not None:
+                await self._run_event_driven(wakeups, check_interval)
+                return
+            
+            while True:
+                try:
+                    processed = await self.run_once()
+                    if not processed:
+                        await asyncio.sleep(check_interval)
+                    else:
+                        # If we processed something, check again quickly
+                        await asyncio.sleep(2)
+                        
+                except KeyboardInterrupt:
+                    self.logger.info("Suggestion consumer stopped by user")
+                    break
+                except Exception as e:
+                    self.logger.error(f"Error in continuous loop: {e}")
+                    await asyncio.sleep(check_interval)
+        finally:
+            self.flush_execution_log()
+    
+    async def _run_event_driven(self, wakeups: asyncio.Queue, check_interval: int):
+        """Process suggestions as the watcher reports writes to the suggestion file"""
         while True:
             try:
                 processed = await self.run_once()
-                if not processed:
-                    await asyncio.sleep(check_interval)
-                else:
-                    # If we processed something, check again quickly
-                    await asyncio.sleep(2)
+                # Recheck on a timer too, in case an event was missed
+                try:
+                    await asyncio.wait_for(wakeups.get(), timeout=2 if processed else check_interval)
+                except asyncio.TimeoutError:
+                    pass
+                # Coalesce bursts of events from a single write
+                while not wakeups.empty():
+                    wakeups.get_nowait()
                     
             except KeyboardInterrupt:
                 self.logger.info("Suggestion consumer stopped by user")
@@ -371,6 +779,52 @@ class SuggestionConsumer:
                 self.logger.error(f"Error in continuous loop: {e}")
                 await asyncio.sleep(check_interval)
     
+    async def _run_concurrent(self, wakeups: Optional[asyncio.Queue], check_interval: int):
+        """Claim suggestions as they appear and run up to max_concurrency at once"""
+        # One slot: at most one claimed suggestion waits while all workers are busy
+        pending = asyncio.Queue(maxsize=1)
+        
+        async def worker():
+            while True:
+                command, inflight = await pending.get()
+                try:
+                    await self._process_claimed(command, inflight)
+                except Exception as e:
+                    self.logger.error(f"Error processing suggestion: {e}")
+                finally:
+                    pending.task_done()
+        
+        workers = [asyncio.ensure_future(worker()) for _ in range(self.max_concurrency)]
+        self.logger.info(f"Running up to {self.max_concurrency} suggestions concurrently")
+        try:
+            while True:
+                try:
+                    self.load_config()
+                    command = await self.check_for_suggestions() if self.auto_execution_enabled else None
+                    if command:
+                        await pending.put((command, self._take_inflight()))
+                        continue
+                    
+                    if wakeups is None:
+                        await asyncio.sleep(check_interval)
+                    else:
+                        try:
+                            await asyncio.wait_for(wakeups.get(), timeout=check_interval)
+                        except asyncio.TimeoutError:
+                            pass
+                        while not wakeups.empty():
+                            wakeups.get_nowait()
+                            
+                except KeyboardInterrupt:
+                    self.logger.info("Suggestion consumer stopped by user")
+                    break
+                except Exception as e:
+                    self.logger.error(f"Error in continuous loop: {e}")
+                    await asyncio.sleep(check_interval)
+        finally:
+            for task in workers:
+                task.cancel()
+    
     def get_execution_stats(self) -> Dict:
         """Get execution statistics"""
         stats = {
@@ -380,31 +834,97 @@ class SuggestionConsumer:
             'recent_commands': []
         }
         
-        if self.execution_log.exists():
-            try:
-                with open(self.execution_log) as f:
-                    for line in f:
-                        entry = json.loads(line.strip())
-                        stats['total_executions'] += 1
-                        
-                        if entry['success']:
-                            stats['successful_executions'] += 1
-                        else:
-                            stats['failed_executions'] += 1
-                        
-                        # Keep last 10 commands
-                        if len(stats['recent_commands']) < 10:
-                            stats['recent_commands'].append({
-                                'command': entry['command'],
-                                'success': entry['success'],
-                                'timestamp': entry['timestamp'],
-                                'duration': entry.get('duration', 0)
-                            })
-                            
-            except Exception as e:
-                stats['error'] = str(e)
+        self.flush_execution_log()
+        try:
+            st = os.stat(self.execution_log)
+        except FileNotFoundError:
+            return stats
+        
+        # Resume the counters from the last snapshot unless the log was replaced
+        # or truncated; a malformed or old-format snapshot means a full rescan
+        counters = {key: 0 for key in _STATS_COUNTERS}
+        offset = 0
+        snapshot = self._load_stats_snapshot()
+        try:
+            if snapshot and snapshot.get('inode') == st.st_ino:
+                resumed = {key: int(snapshot['stats'][key]) for key in _STATS_COUNTERS}
+                resumed_offset = int(snapshot['offset'])
+                if 0 <= resumed_offset <= st.st_size:
+                    counters.update(resumed)
+                    offset = resumed_offset
+        except (AttributeError, KeyError, TypeError, ValueError):
+            pass
+        
+        try:
+            with open(self.execution_log, 'rb') as f:
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        # Entry still being written; leave it for the next read
+                        break
+                    self._count_log_entry(counters, _loads_json(line))
+                    offset += len(line)
+            
+            self._save_stats_snapshot(st.st_ino, offset, counters)
+            
+            stats['recent_commands'] = self._recent_commands(st.st_size)
+        except Exception as e:
+            stats['error'] = str(e)
         
+        stats.update(counters)
         return stats
+    
+    def _count_log_entry(self, counters: Dict, entry: Dict):
+        """Fold one execution log entry into the stats counters"""
+        counters['total_executions'] += 1
+        
+        if entry['success']:
+            counters['successful_executions'] += 1
+        else:
+            counters['failed_executions'] += 1
+    
+    def _recent_commands(self, size: int, limit: int = 10) -> List[Dict]:
+        """Summarize the last entries of the execution log, reading only its tail"""
+        window = 64 * 1024
+        with open(self.execution_log, 'rb') as f:
+            while True:
+                start = max(0, size - window)
+                f.seek(start)
+                lines = f.read(size - start).split(b'\n')
+                lines.pop()  # empty, or an entry still being written
+                if start > 0:
+                    lines = lines[1:]  # may begin mid-entry
+                lines = [line for line in lines if line.strip()]
+                if len(lines) >= limit or start == 0:
+                    break
+                window *= 4
+        
+        recent = []
+        for line in lines[-limit:]:
+            entry = _loads_json(line)
+            recent.append({
+                'command': entry['command'],
+                'success': entry['success'],
+                'timestamp': entry['timestamp'],
+                'duration': entry.get('duration', 0)
+            })
+        return recent
+    
+    def _load_stats_snapshot(self) -> Optional[Dict]:
+        """Load the stats computed up to a byte offset of the execution log"""
+        try:
+            with open(self.stats_snapshot, 'rb') as f:
+                return _loads_json(f.read())
+        except (OSError, ValueError):
+            return None
+    
+    def _save_stats_snapshot(self, inode: int, offset: int, stats: Dict):
+        """Persist stats so the next call only parses entries appended since"""
+        try:
+            with open(self.stats_snapshot, 'wb') as f:
+                f.write(_dumps_log_line({'inode': inode, 'offset': offset, 'stats': stats}))
+        except OSError as e:
+            self.logger.warning(f"Could not save execution stats snapshot: {e}")
 
 def main():
     """Main function for running suggestion consumer"""
@@ -419,22 +939,32 @@ def main():
     args = parser.parse_args()
     
     consumer = SuggestionConsumer()
-    
-    if args.stats:
-        stats = consumer.get_execution_stats()
-        print(json.dumps(stats, indent=2))
-        return
-    
-    if args.once:
-        result = asyncio.run(consumer.run_once())
-        if result:
-            print("Suggestion processed")
+    try:
+        if args.stats:
+            stats = consumer.get_execution_stats()
+            if orjson is not None:
+                # Pretty-printed straight to bytes, no intermediate str
+                sys.stdout.flush()
+                sys.stdout.buffer.write(orjson.dumps(stats, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+                sys.stdout.buffer.flush()
+            else:
+                json.dump(stats, sys.stdout, indent=2)
+                sys.stdout.write('\n')
+            return
+        
+        if args.once:
+            result = asyncio.run(consumer.run_once())
+            if result:
+                print("Suggestion processed")
+            else:
+                print("No suggestions found")
+        elif args.continuous:
+            asyncio.run(consumer.run_continuous(args.interval))
         else:
-            print("No suggestions found")
-    elif args.continuous:
-        asyncio.run(consumer.run_continuous(args.interval))
-    else:
-        print("Use --once, --continuous, or --stats")
+            print("Use --once, --continuous, or --stats")
+    finally:
+        # Flush buffered log entries and release the log descriptor
+        consumer.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -10,6 +10,40 @@ import re
 from pathlib import Path
 import argparse
 from typing import List, Dict, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Main task line: - [ ] 1.2. Task description
+# ([^\S\n] keeps each match on a single line when scanning the whole document)
+_TASK_RE = re.compile(
+    r'^-[^\S\n]*\[([ x])\][^\S\n]*(\d+(?:\.\d+)*)[^\S\n]*\.?[^\S\n]*(.+)$',
+    re.MULTILINE,
+)
+# Dependency note inside a task's detail lines: [depends on: 1, 2.1]
+_DEP_RE = re.compile(r'\[depends on:\s*([\d.,\s]+)\]', re.IGNORECASE)
+
+# Working directory -> nearest ancestor holding .claude
+_PROJECT_ROOT_CACHE: Dict[Path, Path] = {}
+
+def _find_project_root() -> Path:
+    """Locate the project root from the working directory, once per directory"""
+    cwd = Path.cwd()
+    root = _PROJECT_ROOT_CACHE.get(cwd)
+    if root is None:
+        current = cwd
+        while current != current.parent:
+            if (current / '.claude').exists():
+                root = current
+                break
+            current = current.parent
+        else:
+            root = cwd
+        _PROJECT_ROOT_CACHE[cwd] = root
+    return root
 
 class TaskCommandGenerator:
     def __init__(self, spec_name: str, project_root=None):
@@ -18,18 +52,22 @@ class TaskCommandGenerator:
         if project_root:
             self.project_root = Path(project_root)
         else:
-            current = Path.cwd()
-            while current != current.parent:
-                if (current / '.claude').exists():
-                    self.project_root = current
-                    break
-                current = current.parent
-            else:
-                self.project_root = Path.cwd()
+            self.project_root = _find_project_root()
         
         self.spec_dir = self.project_root / '.claude' / 'specs' / spec_name
         self.commands_dir = self.project_root / '.claude' / 'commands' / spec_name
         self.tasks_file = self.spec_dir / 'tasks.md'
+        
+        # Path fragments shared by every generated command file
+        self._requirements_path_str = f".claude/specs/{spec_name}/requirements.md"
+        self._design_path_str = f".claude/specs/{spec_name}/design.md"
+        self._usage_prefix = f"/{spec_name}-task-"
+        
+        # (tasks list, graph) for the last list passed to _build_graph
+        self._graph_cache = None
+        
+        # Progress messages from generate_all, written out in one go
+        self._log: List[str] = []
     
     def parse_tasks(self) -> List[Dict]:
         """Parse tasks from tasks.md"""
@@ -37,50 +75,43 @@ class TaskCommandGenerator:
             print(f"Error: tasks.md not found at {self.tasks_file}", file=sys.stderr)
             sys.exit(1)
         
-        content = self.tasks_file.read_text(encoding='utf-8')
+        with open(self.tasks_file, 'r', encoding='utf-8', buffering=1 << 20) as fh:
+            content = fh.read()
         tasks = []
         
-        # Parse task format with details
-        current_task = None
-        in_task_details = False
-        
-        for line in content.split('\n'):
-            # Main task line: - [ ] 1.2. Task description
-            task_match = re.match(r'^-\s*\[([ x])\]\s*(\d+(?:\.\d+)*)\s*\.?\s*(.+)$', line)
-            if task_match:
-                if current_task:
-                    tasks.append(current_task)
-                
-                completed = task_match.group(1).lower() == 'x'
-                task_id = task_match.group(2)
-                description = task_match.group(3).strip()
-                
-                current_task = {
-                    'id': task_id,
-                    'description': description,
-                    'completed': completed,
-                    'details': [],
-                    'dependencies': []
-                }
-                in_task_details = True
+        # Locate task lines directly; each task's details live between its
+        # line and the next task line
+        matches = list(_TASK_RE.finditer(content))
+        for i, task_match in enumerate(matches):
+            completed = task_match.group(1).lower() == 'x'
+            # Interned: ids are compared and hashed all over the dependency graph
+            task_id = sys.intern(task_match.group(2))
+            description = task_match.group(3).strip()
             
-            # Task details (indented lines)
-            elif in_task_details and line.startswith('  ') and line.strip():
-                if current_task:
+            current_task = {
+                'id': task_id,
+                'id_slug': task_id.replace('.', '-'),
+                'description': description,
+                'completed': completed,
+                'details': [],
+                'dependencies': []
+            }
+            
+            region_end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
+            for line in content[task_match.end() + 1:region_end].split('\n'):
+                # Empty line ends task details
+                if not line.strip():
+                    break
+                # Task details (indented lines)
+                if line.startswith('  '):
                     # Check for dependency notation
-                    dep_match = re.match(r'.*\[depends on:\s*([\d.,\s]+)\].*', line, re.IGNORECASE)
+                    dep_match = _DEP_RE.search(line)
                     if dep_match:
-                        deps = [d.strip() for d in dep_match.group(1).split(',')]
+                        deps = [sys.intern(d.strip()) for d in dep_match.group(1).split(',')]
                         current_task['dependencies'].extend(deps)
                     else:
                         current_task['details'].append(line.strip())
             
-            # Empty line ends task details
-            elif not line.strip():
-                in_task_details = False
-        
-        # Don't forget the last task
-        if current_task:
             tasks.append(current_task)
         
         return tasks
@@ -88,6 +119,9 @@ class TaskCommandGenerator:
     def generate_command_file(self, task: Dict) -> str:
         """Generate command file content for a task"""
         task_id = task['id']
+        details = task['details']
+        research_lines = '\n'.join([f'   - {detail}' for detail in details[:3]]) or '   - Task implementation patterns'
+        detail_lines = '\n'.join([f'- {detail}' for detail in details]) or 'See tasks.md for full details'
         
         template = f"""# Task {task_id}: {task['description']}
 
@@ -101,8 +135,8 @@ Execute implementation task {task_id} for {self.spec_name} specification.
    python .claude/scripts/get_tasks.py {self.spec_name} {task_id} --mode single
    
    # Load relevant specifications:
-   python .claude/scripts/get_content.py .claude/specs/{self.spec_name}/requirements.md
-   python .claude/scripts/get_content.py .claude/specs/{self.spec_name}/design.md
+   python .claude/scripts/get_content.py {self._requirements_path_str}
+   python .claude/scripts/get_content.py {self._design_path_str}
    
    # Load technical context:
    python .claude/scripts/get_content.py .claude/steering/tech.md
@@ -110,7 +144,7 @@ Execute implementation task {task_id} for {self.spec_name} specification.
 
 2. **Pre-Implementation Research** (if needed)
    Use spec-design-web-researcher agent to verify modern patterns for:
-   {chr(10).join(f'   - {detail}' for detail in task['details'][:3]) if task['details'] else '   - Task implementation patterns'}
+   {research_lines}
 
 3. **Implementation**
    Use spec-task-executor agent to:
@@ -132,7 +166,7 @@ Execute implementation task {task_id} for {self.spec_name} specification.
    ```
 
 ## Task Details
-{chr(10).join(f'- {detail}' for detail in task['details']) if task['details'] else 'See tasks.md for full details'}
+{detail_lines}
 
 ## Dependencies
 {f"This task depends on: {', '.join(task['dependencies'])}" if task['dependencies'] else "No dependencies"}
@@ -144,16 +178,33 @@ Execute implementation task {task_id} for {self.spec_name} specification.
 
 ## Usage
 ```
-/{self.spec_name}-task-{task_id.replace('.', '-')}
+{self._usage_prefix}{task['id_slug']}
 ```
 """
         return template
     
-    def analyze_dependencies(self, tasks: List[Dict]) -> Dict[str, Set[str]]:
-        """Analyze task dependencies and find parallelization opportunities"""
-        # Build dependency graph
+    def _build_graph(self, tasks: List[Dict]) -> Dict:
+        """Build the task dependency graph once per task list
+        
+        Returns the dependency sets, successor lists and Kahn levels; the result
+        is reused while the same list object is passed back in.
+        """
+        if self._graph_cache is not None and self._graph_cache[0] is tasks:
+            return self._graph_cache[1]
+        
+        # Flat task list: no declared or parent dependencies, one level
+        if not any(task['dependencies'] or '.' in task['id'] for task in tasks):
+            task_ids = list(dict.fromkeys(task['id'] for task in tasks))
+            graph = {
+                'dependencies': {task_id: frozenset() for task_id in task_ids},
+                'successors': {task_id: [] for task_id in task_ids},
+                'levels': [task_ids] if task_ids else []
+            }
+            self._graph_cache = (tasks, graph)
+            return graph
+        
         dep_graph = {}
-        all_task_ids = {task['id'] for task in tasks}
+        all_task_ids = frozenset(task['id'] for task in tasks)
         
         for task in tasks:
             task_id = task['id']
@@ -166,42 +217,55 @@ Execute implementation task {task_id} for {self.spec_name} specification.
             
             # Implicit dependencies (parent tasks)
             if '.' in task_id:
-                parent = '.'.join(task_id.split('.')[:-1])
+                parent = sys.intern(task_id.rsplit('.', 1)[0])
                 if parent in all_task_ids:
                     deps.add(parent)
             
-            dep_graph[task_id] = deps
-        
-        # Find parallel groups
-        parallel_groups = []
-        processed = set()
-        
-        for task_id in sorted(all_task_ids):
-            if task_id not in processed:
-                # Find all tasks that can run in parallel with this one
-                group = {task_id}
-                for other_id in all_task_ids:
-                    if other_id not in processed and other_id != task_id:
-                        # Check if they have conflicting dependencies
-                        if not (dep_graph[task_id] & {other_id}) and not (dep_graph[other_id] & {task_id}):
-                            # Check if they have the same dependencies
-                            if dep_graph[task_id] == dep_graph[other_id]:
-                                group.add(other_id)
-                
-                if len(group) > 1:
-                    parallel_groups.append(group)
-                processed.update(group)
+            # Frozen: the graph is cached and handed out to callers
+            dep_graph[task_id] = frozenset(deps)
         
-        return {
+        # Kahn levels: each level holds the tasks whose dependencies all sit in
+        # earlier levels, so its members can run together
+        indegree = {task_id: len(deps) for task_id, deps in dep_graph.items()}
+        successors = {task_id: [] for task_id in dep_graph}
+        for task_id, deps in dep_graph.items():
+            for dep in deps:
+                successors[dep].append(task_id)
+        
+        levels = []
+        ready = [task_id for task_id, degree in indegree.items() if degree == 0]
+        while ready:
+            levels.append(ready)
+            next_ready = []
+            for task_id in ready:
+                for successor in successors[task_id]:
+                    indegree[successor] -= 1
+                    if indegree[successor] == 0:
+                        next_ready.append(successor)
+            ready = next_ready
+        
+        graph = {
             'dependencies': dep_graph,
-            'parallel_groups': parallel_groups
+            'successors': successors,
+            'levels': levels
+        }
+        self._graph_cache = (tasks, graph)
+        return graph
+    
+    def analyze_dependencies(self, tasks: List[Dict]) -> Dict[str, Set[str]]:
+        """Analyze task dependencies and find parallelization opportunities"""
+        graph = self._build_graph(tasks)
+        
+        return {
+            'dependencies': graph['dependencies'],
+            'parallel_groups': [set(level) for level in graph['levels'] if len(level) > 1]
         }
     
     def generate_orchestration_script(self, tasks: List[Dict], analysis: Dict) -> str:
         """Generate an orchestration script for the specification"""
         parallel_groups = analysis.get('parallel_groups', [])
         
-        script = f"""#!/usr/bin/env python3
+        parts = [f"""#!/usr/bin/env python3
 \"\"\"
 Orchestration script for {self.spec_name} specification
 Auto-generated by task-generator.py
@@ -211,62 +275,95 @@ import subprocess
 import sys
 from pathlib import Path
 
-def run_task(spec_name, task_id):
+# get_tasks.py sits next to this script; importing it saves a Python
+# start-up per task
+sys.path.insert(0, str(Path(__file__).parent))
+try:
+    from get_tasks import TaskManager
+except ImportError:
+    TaskManager = None
+
+# One TaskManager per spec, shared by every task
+_task_managers = {{}}
+
+def run_task(spec_name, task_id, task_slug):
     \"\"\"Execute a single task\"\"\"
     print(f"\\n{'='*60}")
     print(f"Executing Task {{task_id}}")
     print('='*60)
     
     # Run the task command
-    cmd = f"/{{spec_name}}-task-{{task_id.replace('.', '-')}}"
+    cmd = f"/{{spec_name}}-task-{{task_slug}}"
     print(f"Running: {{cmd}}")
     # In real implementation, this would invoke Claude Code
     # For now, we'll mark it complete
     
     # Mark task complete
-    subprocess.run([
-        sys.executable, 
-        ".claude/scripts/get_tasks.py", 
-        spec_name, 
-        task_id, 
-        "--mode", 
-        "complete"
-    ])
+    if TaskManager is not None:
+        manager = _task_managers.get(spec_name)
+        if manager is None:
+            manager = _task_managers[spec_name] = TaskManager(spec_name)
+        try:
+            manager.mark_complete(task_id)
+        except SystemExit:
+            pass  # get_tasks has already reported the error
+    else:
+        subprocess.run([
+            sys.executable, 
+            ".claude/scripts/get_tasks.py", 
+            spec_name, 
+            task_id, 
+            "--mode", 
+            "complete"
+        ])
 
 def main():
     spec_name = "{self.spec_name}"
     
     print(f"Starting orchestration for: {{spec_name}}")
     print(f"Total tasks: {len(tasks)}")
-"""
+"""]
         
         # Add parallel execution info
         if parallel_groups:
-            script += f"""
+            parts.append(f"""
     print("\\nParallel execution opportunities found!")
     parallel_groups = {parallel_groups}
-"""
+""")
         
         # Add task execution
-        script += """
+        parts.append("""
     # Execute tasks in dependency order
     tasks_to_run = [
-"""
-        for task in tasks:
-            if not task['completed']:
-                script += f'        "{task["id"]}",\n'
+""")
+        # Dependency order from the shared graph; tasks caught in a cycle go last
+        pending = {task['id']: task['id_slug'] for task in tasks if not task['completed']}
+        ordered = [task_id for level in self._build_graph(tasks)['levels'] for task_id in level]
+        ordered_ids = set(ordered)
+        ordered.extend(task['id'] for task in tasks if task['id'] not in ordered_ids)
+        parts.extend(f'        ("{task_id}", "{pending[task_id]}"),\n' for task_id in ordered if task_id in pending)
         
-        script += """    ]
+        parts.append("""    ]
     
-    for task_id in tasks_to_run:
-        run_task(spec_name, task_id)
+    for task_id, task_slug in tasks_to_run:
+        run_task(spec_name, task_id, task_slug)
     
     print(f"\\nOrchestration complete!")
 
 if __name__ == "__main__":
     main()
-"""
-        return script
+""")
+        return ''.join(parts)
+    
+    def _flush_log(self):
+        """Write buffered progress messages with a single stdout write"""
+        text = '\n'.join(self._log) + '\n'
+        self._log.clear()
+        try:
+            sys.stdout.write(text)
+        except UnicodeEncodeError:
+            sys.stdout.write(text.replace('✓', '[OK]'))
+        sys.stdout.flush()
     
     def generate_all(self):
         """Generate all task commands and orchestration"""
@@ -279,29 +376,35 @@ if __name__ == "__main__":
             print("No tasks found in tasks.md")
             return
         
-        print(f"Found {len(tasks)} tasks for {self.spec_name}")
+        self._log.append(f"Found {len(tasks)} tasks for {self.spec_name}")
         
         # Generate command files
-        generated = []
+        # Partition in one pass: completed tasks are skipped
+        pending = []
         skipped = []
-        
         for task in tasks:
             if task['completed']:
                 skipped.append(task['id'])
-                continue
-            
+            else:
+                pending.append(task)
+        generated = [task['id'] for task in pending]
+        
+        jobs = []
+        for task in pending:
             # Generate command file
             command_content = self.generate_command_file(task)
-            command_filename = f"task-{task['id'].replace('.', '-')}.md"
-            command_path = self.commands_dir / command_filename
-            
-            command_path.write_text(command_content, encoding='utf-8')
-            generated.append(task['id'])
-            
-            try:
-                print(f"✓ Generated: /{self.spec_name}-{command_filename[:-3]}")
-            except UnicodeEncodeError:
-                print(f"[OK] Generated: /{self.spec_name}-{command_filename[:-3]}")
+            command_filename = f"task-{task['id_slug']}.md"
+            jobs.append((task['id'], command_filename, self.commands_dir / command_filename, command_content))
+        
+        # The files are independent, so overlap their writes
+        if len(jobs) > 1:
+            with ThreadPoolExecutor(max_workers=min(32, len(jobs))) as executor:
+                list(executor.map(lambda job: job[2].write_text(job[3], encoding='utf-8'), jobs))
+        else:
+            for _, _, command_path, command_content in jobs:
+                command_path.write_text(command_content, encoding='utf-8')
+        
+        self._log.extend(f"✓ Generated: /{self.spec_name}-{command_filename[:-3]}" for _, command_filename, _, _ in jobs)
         
         # Analyze dependencies
         analysis = self.analyze_dependencies(tasks)
@@ -311,20 +414,19 @@ if __name__ == "__main__":
         orchestration_path = self.project_root / '.claude' / 'scripts' / f'orchestrate-{self.spec_name}.py'
         orchestration_path.write_text(orchestration_content, encoding='utf-8')
         
-        try:
-            print(f"\n✓ Generated orchestration script: {orchestration_path.name}")
-        except UnicodeEncodeError:
-            print(f"\n[OK] Generated orchestration script: {orchestration_path.name}")
+        self._log.append(f"\n✓ Generated orchestration script: {orchestration_path.name}")
         
         # Summary
-        print(f"\nGeneration Summary:")
-        print(f"- Commands generated: {len(generated)}")
-        print(f"- Tasks skipped (completed): {len(skipped)}")
+        self._log.append(f"\nGeneration Summary:")
+        self._log.append(f"- Commands generated: {len(generated)}")
+        self._log.append(f"- Tasks skipped (completed): {len(skipped)}")
         
         if analysis['parallel_groups']:
-            print(f"\nParallel Execution Opportunities:")
+            self._log.append(f"\nParallel Execution Opportunities:")
             for i, group in enumerate(analysis['parallel_groups'], 1):
-                print(f"  Group {i}: Tasks {', '.join(sorted(group))} can run in parallel")
+                self._log.append(f"  Group {i}: Tasks {', '.join(sorted(group))} can run in parallel")
+        
+        self._flush_log()
         
         return {
             'generated': generated,
@@ -345,7 +447,14 @@ def main():
     if args.analyze_deps:
         tasks = generator.parse_tasks()
         analysis = generator.analyze_dependencies(tasks)
-        print(json.dumps(analysis, indent=2, default=list))
+        # Streamed to stdout rather than built as one str and printed
+        if orjson is not None:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(orjson.dumps(analysis, default=list, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+            sys.stdout.buffer.flush()
+        else:
+            json.dump(analysis, sys.stdout, indent=2, default=list)
+            sys.stdout.write('\n')
     else:
         result = generator.generate_all()
         if result:
@@ -24,12 +24,13 @@ class ContextCompressor:
     
     def __init__(self):
         self.encoder = tiktoken.get_encoding("cl100k_base")
+        # Token counts keyed by a digest of the serialized text
+        self._token_cache = {}
         
     def compress(self, context: Dict[str, Any], max_tokens: int = 4000) -> Dict[str, Any]:
         """Compress context to fit within token limit"""
         # Count current tokens
-        context_str = json.dumps(context)
-        current_tokens = len(self.encoder.encode(context_str))
+        current_tokens = self._count_tokens(context)
         
         if current_tokens <= max_tokens:
             return context
@@ -92,7 +93,14 @@ class ContextCompressor:
         
     def _count_tokens(self, obj: Any) -> int:
         """Count tokens in object"""
-        return len(self.encoder.encode(json.dumps(obj)))
+        text = json.dumps(obj)
+        key = hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest()
+        count = self._token_cache.get(key)
+        if count is None:
+            if len(self._token_cache) >= 1024:
+                self._token_cache.clear()
+            count = self._token_cache[key] = len(self.encoder.encode(text))
+        return count
 
 class ContextSelector:
     """Selects relevant context based on agent and task"""
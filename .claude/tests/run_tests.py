@@ -85,6 +85,7 @@ def main():
     # Define test suites
     test_suites = [
         ('Steering Context Tests', 'test_steering_context.py'),
+        ('Planning Executor Tests', 'test_planning_executor.py'),
         # Add more test files as they're created
         # ('Dashboard Tests', 'test_dashboard.py'),
         # ('Log Management Tests', 'test_log_management.py'),
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Tests for planning executor agent routing and batch scheduling
+Checks routing and batching against the original implementations
+"""
+
+import unittest
+from pathlib import Path
+import sys
+
+# Add archived scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts' / '_archived' / 'cleanup_20250808_152026'))
+
+from planning_executor import _determine_agent, PlanningExecutor, Task
+
+def baseline_agent(description: str) -> str:
+    """Original substring-based routing, kept as the reference"""
+    desc_lower = description.lower()
+
+    if any(word in desc_lower for word in ['model', 'schema', 'database', 'table']):
+        return 'developer'
+    elif any(word in desc_lower for word in ['api', 'endpoint', 'service', 'controller']):
+        return 'developer'
+    elif any(word in desc_lower for word in ['ui', 'component', 'screen', 'page', 'frontend']):
+        return 'developer'
+    elif any(word in desc_lower for word in ['test', 'testing', 'spec']):
+        return 'qa-engineer'
+    elif any(word in desc_lower for word in ['auth', 'security', 'permission']):
+        return 'security-engineer'
+    elif any(word in desc_lower for word in ['pipeline', 'etl', 'data flow']):
+        return 'data-engineer'
+    elif any(word in desc_lower for word in ['deploy', 'ci/cd', 'infrastructure']):
+        return 'devops-engineer'
+    else:
+        return 'developer'
+
+def baseline_batches(tasks):
+    """Original round-based batching, kept as the reference"""
+    batches = []
+    completed = set()
+    remaining = tasks.copy()
+    
+    while remaining:
+        ready = [task for task in remaining if all(dep in completed for dep in task.dependencies)]
+        if not ready:
+            break
+        
+        batch_tasks = [
+            task for task in ready
+            if not any(task.id in other.dependencies for other in ready if other.id != task.id)
+        ]
+        if not batch_tasks:
+            batch_tasks = [ready[0]]
+        
+        batches.append([task.id for task in batch_tasks])
+        for task in batch_tasks:
+            completed.add(task.id)
+            remaining.remove(task)
+    
+    return batches
+
+def make_tasks(specs):
+    """Build Task objects from (id, dependencies) pairs"""
+    return [Task(id=task_id, description='', agent='developer', dependencies=list(deps))
+            for task_id, deps in specs]
+
+class TestAgentRouting(unittest.TestCase):
+    """Test that _determine_agent keeps the baseline routing"""
+
+    DESCRIPTIONS = [
+        'Implement user authentication',
+        'Add OAuth login',
+        'Configure authorization rules',
+        'Deployment to staging',
+        'Deploying the release',
+        'Write unit tests',
+        'Add integration testing',
+        'Review security headers',
+        'Set permissions for admins',
+        'Create ETL pipelines',
+        'Document the data flow',
+        'Set up CI/CD',
+        'Provision infrastructure',
+        'Create user model',
+        'Design database schema',
+        'Add REST endpoints',
+        'Write documentation',
+    ]
+
+    def test_matches_baseline(self):
+        """Each description routes to the baseline agent"""
+        for description in self.DESCRIPTIONS:
+            with self.subTest(description=description):
+                self.assertEqual(_determine_agent(description, ''), baseline_agent(description))
+
+    def test_prefix_matches(self):
+        """Keyword stems cover longer words"""
+        self.assertEqual(_determine_agent('Implement user authentication', ''), 'security-engineer')
+        self.assertEqual(_determine_agent('Add OAuth login', ''), 'security-engineer')
+        self.assertEqual(_determine_agent('Deployment to staging', ''), 'devops-engineer')
+
+class TestExecutionBatches(unittest.TestCase):
+    """Test that execution batches keep the baseline order"""
+    
+    def setUp(self):
+        self.executor = PlanningExecutor('implementation', 'test-spec')
+    
+    def batch_ids(self, tasks):
+        return [[task.id for task in batch.tasks]
+                for batch in self.executor.create_execution_batches(tasks)]
+    
+    def test_unique_ids(self):
+        """Sequential top-level tasks and subtasks batch as before"""
+        tasks = make_tasks([
+            ('1', []), ('1.1', []), ('1.2', ['1.1']), ('2', ['1']), ('2.1', []), ('3', ['2'])
+        ])
+        self.assertEqual(self.batch_ids(tasks), baseline_batches(tasks))
+        self.assertEqual(self.batch_ids(tasks), [['1', '1.1', '2.1'], ['1.2', '2'], ['3']])
+    
+    def test_repeated_ids(self):
+        """A repeated id keeps the baseline batch order"""
+        tasks = make_tasks([
+            ('4', []), ('5', []), ('6', ['5']), ('6', ['5']), ('5', ['4'])
+        ])
+        self.assertEqual(self.batch_ids(tasks), baseline_batches(tasks))
+        self.assertEqual(self.batch_ids(tasks), [['4', '5'], ['6', '6'], ['5']])
+        
+        tasks = make_tasks([
+            ('1', []), ('2', ['1']), ('3', ['2']), ('4', ['3']), ('5', ['4']),
+            ('6', ['5']), ('4', ['3']), ('5', ['4'])
+        ])
+        self.assertEqual(self.batch_ids(tasks), baseline_batches(tasks))
+
+if __name__ == '__main__':
+    unittest.main()